@@ -0,0 +1,4 @@
+-- Index for the scrapers' duplicate check (utilities/check_existing_news.py), which looks
+-- news rows up by (yfin_symbol, title). Articles are stored once per matched symbol, so
+-- this pair identifies a row; it is not UNIQUE because older rows may repeat it.
+CREATE INDEX IF NOT EXISTS idx_news_symbol_title ON news(yfin_symbol, title);
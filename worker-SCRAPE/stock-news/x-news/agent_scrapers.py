@@ -1,22 +1,55 @@
-from playwright.sync_api import sync_playwright
-from hashlib import sha256
+from playwright.async_api import async_playwright
+from hashlib import blake2b
 from datetime import datetime, timezone
 import logging
 import re
 import sys
 from pathlib import Path
+from contextlib import asynccontextmanager
+import asyncio
 import html
+import ahocorasick
+from bisect import bisect_left, bisect_right
 
 # Add utilities path
 sys.path.append(str(Path(__file__).parent / 'utilities'))
 from utilities.get_active_stocks import get_active_stocks
-from utilities.check_existing_news import check_existing_news
-from utilities.store_news_article import store_news_article
-from utilities.load_keywords_scrape import get_all_keywords, fetch_stock_keywords
+from utilities.check_existing_news import find_existing_news
+from utilities.store_news_article import store_news_articles
+from utilities.load_keywords_scrape import get_all_keywords, fetch_stock_keywords, parse_keyword_json
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Precompiled cleaning patterns (compiled once at import instead of on every call)
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# More comprehensive patterns to match time references anywhere in text, fused into a
+# single alternation so the text is scanned once. Surrounding whitespace is left to the
+# final whitespace collapse so a leading \s* can't make a generic pattern match first.
+TIME_REFERENCE_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\b\d+\s*(hour|hours|hr|hrs|minute|minutes|min|mins)\s*ago\b',
+    r'\b(today|yesterday|earlier today|this morning|this evening)\b',
+    r'\b\d+\s*days?\s*ago\b',
+    r'\bLive:\s*',
+    r'\bBreaking:\s*',
+    r'\bUpdate:\s*',
+    r'\d+\s*(minute|minutes|min|hour|hours|hr|day|days)\s*ago',
+    r'Yesterday',
+    r'Today',
+    r'\d+\s*(min|hr)',
+    r'\d+\s*(minute|minutes|hour|hours|day|days)',
+    r'By\s+[A-Za-z\s]+$',  # Remove "By Author Name" at the end
+)), re.IGNORECASE)
+# Author bylines (patterns like "- Author Name" or "| Author Name" at the end)
+BYLINE_PATTERN = re.compile(r'\s*[-|]\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$')
+TRAILING_SEPARATOR_PATTERN = re.compile(r'\s*[-|]\s*$')
+
+def article_fingerprint(title, link):
+    """Short non-cryptographic fingerprint of an article for duplicate detection"""
+    # The NUL separator keeps ("ab", "c") and ("a", "bc") from colliding
+    return blake2b(f"{title}\0{link}".encode('utf-8'), digest_size=16).hexdigest()
+
 def clean_html_content(text):
     """
     Clean HTML entities and unwanted characters from text content
@@ -28,15 +61,15 @@ def clean_html_content(text):
     cleaned = html.unescape(text)
     
     # Remove HTML tags if any
-    cleaned = re.sub(r'<[^>]+>', '', cleaned)
+    if '<' in cleaned:
+        cleaned = HTML_TAG_PATTERN.sub('', cleaned)
     
-    # Remove extra whitespace characters including non-breaking spaces
-    cleaned = re.sub(r'\xa0', ' ', cleaned)  # Non-breaking space
-    cleaned = re.sub(r'\u00a0', ' ', cleaned)  # Unicode non-breaking space
-    cleaned = re.sub(r'&nbsp;', ' ', cleaned)  # Any remaining &nbsp;
-    cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single space
+    # Any remaining &nbsp; (double-encoded in the source) becomes a space
+    cleaned = cleaned.replace('&nbsp;', ' ')
     
-    return cleaned.strip()
+    # Collapse whitespace runs to single spaces and trim; str.split() already
+    # treats non-breaking spaces as whitespace
+    return ' '.join(cleaned.split())
 
 def clean_time_references(text):
     """
@@ -46,37 +79,143 @@ def clean_time_references(text):
     if not text:
         return text
     
-    # More comprehensive patterns to match time references anywhere in text
-    time_patterns = [
-        r'\b\d+\s*(hour|hours|hr|hrs|minute|minutes|min|mins)\s*ago\b',
-        r'\b(today|yesterday|earlier today|this morning|this evening)\b',
-        r'\b\d+\s*days?\s*ago\b',
-        r'\bLive:\s*',
-        r'\bBreaking:\s*',
-        r'\bUpdate:\s*',
-        r'\s*\d+\s*(minute|minutes|min|hour|hours|hr|day|days)\s*ago\s*',
-        r'\s*Yesterday\s*',
-        r'\s*Today\s*',
-        r'\s*\d+\s*(min|hr)\s*',
-        r'\s*\d+\s*(minute|minutes|hour|hours|day|days)\s*',
-        r'By\s+[A-Za-z\s]+$',  # Remove "By Author Name" at the end
-    ]
-    
-    cleaned_text = text
-    for pattern in time_patterns:
-        cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+    # Replace with a space so words on either side of a removed reference stay apart
+    cleaned_text = TIME_REFERENCE_PATTERN.sub(' ', text)
     
     # Remove author bylines (patterns like "- Author Name" at the end)
-    cleaned_text = re.sub(r'\s*-\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$', '', cleaned_text)
-    cleaned_text = re.sub(r'\s*\|\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$', '', cleaned_text)
+    cleaned_text = BYLINE_PATTERN.sub('', cleaned_text)
     
     # Clean up extra whitespace and trailing punctuation
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-    cleaned_text = re.sub(r'\s*[-|]\s*$', '', cleaned_text).strip()  # Remove trailing - or |
+    cleaned_text = ' '.join(cleaned_text.split())
+    cleaned_text = TRAILING_SEPARATOR_PATTERN.sub('', cleaned_text).strip()  # Remove trailing - or |
     
     return cleaned_text
 
-def is_financially_relevant_context(text, keyword):
+# COMPREHENSIVE Financial context indicators (45+ terms covering all financial aspects)
+FINANCIAL_INDICATORS = (
+    # Core Market/Trading terms
+    'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
+    'equity', 'securities', 'commodity', 'futures', 'options', 'derivatives',
+    
+    # Indian Market Specific
+    'nifty', 'sensex', 'bse', 'nse', 'sebi', 'rbi', 'rupee', 'inr',
+    
+    # Investment Instruments
+    'mutual fund', 'etf', 'ipo', 'fpo', 'listing', 'delisting', 'bond', 'debenture',
+    
+    # Financial Performance Metrics
+    'profit', 'loss', 'revenue', 'earnings', 'ebitda', 'margin', 'turnover',
+    'dividend', 'buyback', 'split', 'bonus', 'rights issue',
+    
+    # Reporting Periods
+    'quarter', 'quarterly', 'q1', 'q2', 'q3', 'q4', 'half year', 'annual',
+    'financial year', 'fy', 'fy24', 'fy25', 'year-on-year', 'yoy', 'qoq',
+    
+    # Business & Corporate
+    'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
+    'corporation', 'limited', 'ltd', 'pvt', 'public', 'private',
+    
+    # Leadership & Governance
+    'management', 'board', 'ceo', 'cfo', 'md', 'chairman', 'director',
+    'shareholder', 'stakeholder', 'promoter', 'institutional',
+    
+    # Economic Environment
+    'economy', 'economic', 'gdp', 'inflation', 'deflation', 'recession',
+    'growth', 'expansion', 'contraction', 'fiscal', 'monetary',
+    
+    # Banking & Finance
+    'bank', 'banking', 'finance', 'financial', 'credit', 'loan', 'deposit',
+    'nbfc', 'fintech', 'insurance', 'fund', 'capital', 'debt',
+    
+    # Policy & Regulation
+    'policy', 'regulation', 'compliance', 'audit', 'governance',
+    'budget', 'tax', 'gst', 'income tax', 'corporate tax',
+    
+    # Valuation & Pricing
+    'valuation', 'price', 'value', 'worth', 'cost', 'expense', 'cap',
+    'market cap', 'enterprise value', 'book value', 'fair value',
+    
+    # Market Sentiment & Movement
+    'bullish', 'bearish', 'rally', 'correction', 'crash', 'bubble',
+    'volatile', 'volatility', 'trend', 'momentum', 'sentiment',
+    'surge', 'plunge', 'spike', 'drop', 'gain', 'fall', 'rise',
+    
+    # Indian Currency Amounts
+    'crore', 'lakh', 'thousand', 'million', 'billion', 'trillion',
+    'rs', 'rupees', '₹', '$', 'usd', 'dollar',
+    
+    # Financial Symbols & Percentages
+    '%', 'percent', 'percentage', 'basis points', 'bps',
+    
+    # Business Operations
+    'merger', 'acquisition', 'takeover', 'divestiture', 'spinoff',
+    'restructuring', 'bankruptcy', 'liquidation', 'ipo', 'opo',
+    'project', 'expansion', 'launch', 'development', 'partnership',
+    'agreement', 'contract', 'deal', 'venture', 'collaboration',
+    'investment', 'funding', 'financing', 'capital raise', 'fundraising',
+    'product', 'service', 'offering', 'facility', 'plant', 'unit',
+    'announces', 'announcement', 'plans', 'strategy', 'initiative',
+    
+    # Results & Performance
+    'results', 'performance', 'outlook', 'guidance', 'forecast',
+    'estimate', 'consensus', 'target', 'recommendation', 'rating'
+)
+
+# Common stopwords and noise terms to filter out for short keywords
+KEYWORD_STOPWORDS = frozenset({
+    'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'up', 'about',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below', 'between',
+    'among', 'through', 'the', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'can', 'may', 'might', 'must', 'shall'
+})
+
+# Financial terms that must sit close to a short (3-4 char) keyword
+NEARBY_FINANCIAL_TERMS = (
+    'stock', 'share', 'market', 'trading', 'profit', 'loss', 'revenue',
+    'earnings', 'dividend', 'company', 'business', 'financial', 'bank',
+    'investment', 'fund', 'rupee', '₹', '%', 'crore', 'lakh'
+)
+
+# Keyword fragments that mark a company name, which is matched more leniently
+COMPANY_NAME_INDICATORS = ('industries', 'bank', 'limited', 'ltd', 'corp', 'company', 'group')
+LONG_COMPANY_NAME_INDICATORS = COMPANY_NAME_INDICATORS + ('technologies',)
+
+def _build_indicator_automaton(indicators):
+    """Aho-Corasick automaton over the indicators; each hit yields (indicator, times listed)"""
+    automaton = ahocorasick.Automaton()
+    for indicator in set(indicators):
+        automaton.add_word(indicator, (indicator, indicators.count(indicator)))
+    automaton.make_automaton()
+    return automaton
+
+# One left-to-right pass over a text reports every financial indicator it contains
+FINANCIAL_INDICATOR_AUTOMATON = _build_indicator_automaton(FINANCIAL_INDICATORS)
+NEARBY_FINANCIAL_TERM_AUTOMATON = _build_indicator_automaton(NEARBY_FINANCIAL_TERMS)
+
+def _scan_financial_indicators(text_lower):
+    """
+    One automaton pass over text_lower, shared by every keyword checked against it.
+    Returns (is_dense, indicator_spans, indicator_starts): is_dense is True once the
+    text holds at least 3 weighted distinct indicators, in which case the scan stops
+    early and no spans are returned; otherwise the (start, end) spans of every
+    indicator occurrence, sorted, with their start offsets for bisecting.
+    """
+    indicator_spans = []
+    found_indicators = set()
+    indicator_count = 0
+    for end, (indicator, weight) in FINANCIAL_INDICATOR_AUTOMATON.iter(text_lower):
+        indicator_spans.append((end + 1 - len(indicator), end + 1))
+        if indicator not in found_indicators:
+            found_indicators.add(indicator)
+            indicator_count += weight
+            if indicator_count >= 3:  # At least 3 financial terms suggest it's finance-related
+                return True, None, None
+    
+    indicator_spans.sort()
+    return False, indicator_spans, [start for start, _ in indicator_spans]
+
+def is_financially_relevant_context(text_lower, keyword_lower, indicator_scan=None):
     """
     PRODUCTION-READY financial context validation with comprehensive indicators
     Based on extensive testing with real stock database keywords (Nov 8, 2025)
@@ -89,112 +228,173 @@ def is_financially_relevant_context(text, keyword):
     
     This function helps reduce false positives by ensuring the article is actually about finance/business.
     Tested accuracy: 92.9% on challenging edge cases
+    
+    Both arguments must already be lowercased; callers lower the text once and reuse it.
+    Pass indicator_scan from _scan_financial_indicators(text_lower) when checking
+    several keywords against the same text.
     """
-    if not text or not keyword:
+    if not text_lower or not keyword_lower:
         return False
     
-    # COMPREHENSIVE Financial context indicators (45+ terms covering all financial aspects)
-    financial_indicators = [
-        # Core Market/Trading terms
-        'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
-        'equity', 'securities', 'commodity', 'futures', 'options', 'derivatives',
-        
-        # Indian Market Specific
-        'nifty', 'sensex', 'bse', 'nse', 'sebi', 'rbi', 'rupee', 'inr',
-        
-        # Investment Instruments
-        'mutual fund', 'etf', 'ipo', 'fpo', 'listing', 'delisting', 'bond', 'debenture',
-        
-        # Financial Performance Metrics
-        'profit', 'loss', 'revenue', 'earnings', 'ebitda', 'margin', 'turnover',
-        'dividend', 'buyback', 'split', 'bonus', 'rights issue',
-        
-        # Reporting Periods
-        'quarter', 'quarterly', 'q1', 'q2', 'q3', 'q4', 'half year', 'annual',
-        'financial year', 'fy', 'fy24', 'fy25', 'year-on-year', 'yoy', 'qoq',
-        
-        # Business & Corporate
-        'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
-        'corporation', 'limited', 'ltd', 'pvt', 'public', 'private',
-        
-        # Leadership & Governance
-        'management', 'board', 'ceo', 'cfo', 'md', 'chairman', 'director',
-        'shareholder', 'stakeholder', 'promoter', 'institutional',
-        
-        # Economic Environment
-        'economy', 'economic', 'gdp', 'inflation', 'deflation', 'recession',
-        'growth', 'expansion', 'contraction', 'fiscal', 'monetary',
-        
-        # Banking & Finance
-        'bank', 'banking', 'finance', 'financial', 'credit', 'loan', 'deposit',
-        'nbfc', 'fintech', 'insurance', 'fund', 'capital', 'debt',
-        
-        # Policy & Regulation
-        'policy', 'regulation', 'compliance', 'audit', 'governance',
-        'budget', 'tax', 'gst', 'income tax', 'corporate tax',
-        
-        # Valuation & Pricing
-        'valuation', 'price', 'value', 'worth', 'cost', 'expense', 'cap',
-        'market cap', 'enterprise value', 'book value', 'fair value',
-        
-        # Market Sentiment & Movement
-        'bullish', 'bearish', 'rally', 'correction', 'crash', 'bubble',
-        'volatile', 'volatility', 'trend', 'momentum', 'sentiment',
-        'surge', 'plunge', 'spike', 'drop', 'gain', 'fall', 'rise',
-        
-        # Indian Currency Amounts
-        'crore', 'lakh', 'thousand', 'million', 'billion', 'trillion',
-        'rs', 'rupees', '₹', '$', 'usd', 'dollar',
-        
-        # Financial Symbols & Percentages
-        '%', 'percent', 'percentage', 'basis points', 'bps',
-        
-        # Business Operations
-        'merger', 'acquisition', 'takeover', 'divestiture', 'spinoff',
-        'restructuring', 'bankruptcy', 'liquidation', 'ipo', 'opo',
-        'project', 'expansion', 'launch', 'development', 'partnership',
-        'agreement', 'contract', 'deal', 'venture', 'collaboration',
-        'investment', 'funding', 'financing', 'capital raise', 'fundraising',
-        'product', 'service', 'offering', 'facility', 'plant', 'unit',
-        'announces', 'announcement', 'plans', 'strategy', 'initiative',
-        
-        # Results & Performance
-        'results', 'performance', 'outlook', 'guidance', 'forecast',
-        'estimate', 'consensus', 'target', 'recommendation', 'rating'
-    ]
-    
-    text_lower = text.lower()
-    
-    # Find all positions of the keyword
-    keyword_positions = []
-    start = 0
-    while True:
-        pos = text_lower.find(keyword.lower(), start)
-        if pos == -1:
-            break
-        keyword_positions.append(pos)
-        start = pos + 1
+    # If the text contains multiple financial indicators, it's likely relevant
+    if indicator_scan is None:
+        indicator_scan = _scan_financial_indicators(text_lower)
+    is_dense, indicator_spans, indicator_starts = indicator_scan
+    if is_dense:
+        return True
+    if not indicator_spans:
+        return False
     
     # For each keyword occurrence, check surrounding context (100 characters before and after)
+    # for an indicator that lies entirely inside it
     context_window = 100
-    for pos in keyword_positions:
+    pos = text_lower.find(keyword_lower)
+    while pos != -1:
         start_context = max(0, pos - context_window)
-        end_context = min(len(text_lower), pos + len(keyword) + context_window)
-        context = text_lower[start_context:end_context]
+        end_context = min(len(text_lower), pos + len(keyword_lower) + context_window)
         
-        # Check if any financial indicator is in this context
-        for indicator in financial_indicators:
-            if indicator in context:
+        i = bisect_left(indicator_starts, start_context)
+        while i < len(indicator_spans) and indicator_starts[i] < end_context:
+            if indicator_spans[i][1] <= end_context:
                 return True
-    
-    # Additional check: if the text contains multiple financial indicators, it's likely relevant
-    indicator_count = sum(1 for indicator in financial_indicators if indicator in text_lower)
-    if indicator_count >= 3:  # At least 3 financial terms suggest it's finance-related
-        return True
+            i += 1
+        
+        pos = text_lower.find(keyword_lower, pos + 1)
     
     return False
 
-def enhanced_keyword_matching(text, keywords):
+def _is_word_char(char):
+    """Same definition of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+def _has_word_boundary(text, start, end):
+    """True when text[start:end] is delimited like the regex \\b...\\b would require"""
+    before_is_word = start > 0 and _is_word_char(text[start - 1])
+    after_is_word = end < len(text) and _is_word_char(text[end])
+    return (before_is_word != _is_word_char(text[start])
+            and after_is_word != _is_word_char(text[end - 1]))
+
+def _matches_without_context(keyword, keyword_lower):
+    """True for company-name keywords, which enhanced_keyword_matching accepts without financial context"""
+    if len(keyword) <= 4:
+        return False
+    if len(keyword) <= 8:
+        return any(company_indicator in keyword_lower for company_indicator in COMPANY_NAME_INDICATORS)
+    return any(company_indicator in keyword_lower for company_indicator in LONG_COMPANY_NAME_INDICATORS)
+
+class KeywordMatcher:
+    """
+    Aho-Corasick index over a keyword list, built once and reused for every article.
+    A single pass over the lowercased text reports every keyword occurrence, replacing
+    one regex compile-and-scan per keyword.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+        # keyword_lower -> [(position in keyword list, stripped keyword), ...]
+        self._entries = {}
+        self._automaton = ahocorasick.Automaton()
+        # Company-name keywords, the only ones that can match without a financial indicator
+        self._context_free_automaton = ahocorasick.Automaton()
+        self._has_context_free = False
+        
+        for index, keyword in enumerate(keywords):
+            if not keyword or len(keyword.strip()) == 0:
+                continue
+            
+            keyword = keyword.strip()
+            # Filter out very short keywords (≤2 characters) - too prone to false positives
+            if len(keyword) <= 2:
+                continue
+            
+            keyword_lower = keyword.lower()
+            # Skip if keyword is a common stopword
+            if keyword_lower in KEYWORD_STOPWORDS:
+                continue
+            if keyword_lower not in self._entries:
+                self._entries[keyword_lower] = []
+                self._automaton.add_word(keyword_lower, keyword_lower)
+            self._entries[keyword_lower].append((index, keyword))
+            
+            if _matches_without_context(keyword, keyword_lower):
+                self._context_free_automaton.add_word(keyword_lower, keyword_lower)
+                self._has_context_free = True
+        
+        if self._entries:
+            self._automaton.make_automaton()
+        if self._has_context_free:
+            self._context_free_automaton.make_automaton()
+
+    @classmethod
+    def of(cls, keywords):
+        """Build a matcher from a keyword list, passing through an existing matcher unchanged"""
+        if isinstance(keywords, cls):
+            return keywords
+        return cls(keywords)
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def scan(self, text_lower, context_free_only=False):
+        """
+        Find the keywords present in text_lower.
+        Returns [(keyword, keyword_lower, has_word_boundary_match), ...] in keyword-list order.
+        With context_free_only, only company-name keywords are looked for.
+        """
+        if context_free_only:
+            if not self._has_context_free:
+                return []
+            automaton = self._context_free_automaton
+        elif self._entries:
+            automaton = self._automaton
+        else:
+            return []
+        
+        boundary_hits = {}
+        for end_index, keyword_lower in automaton.iter(text_lower):
+            if boundary_hits.get(keyword_lower):
+                continue
+            start = end_index - len(keyword_lower) + 1
+            boundary_hits[keyword_lower] = _has_word_boundary(text_lower, start, end_index + 1)
+        
+        return self._ordered_hits(boundary_hits)
+
+    def scan_many(self, texts_lower):
+        """
+        scan() for a batch of short texts such as headlines, in one automaton pass.
+        The texts are joined with NUL separators, which no keyword contains and which
+        count as a word boundary, so hits never span two texts and boundaries are
+        judged exactly as they would be per text.
+        """
+        if not self._entries or not texts_lower:
+            return [[] for _ in texts_lower]
+        
+        text_starts = []
+        offset = 0
+        for text_lower in texts_lower:
+            text_starts.append(offset)
+            offset += len(text_lower) + 1
+        buffer = '\0'.join(texts_lower)
+        
+        boundary_hits = [{} for _ in texts_lower]
+        for end_index, keyword_lower in self._automaton.iter(buffer):
+            start = end_index - len(keyword_lower) + 1
+            hits = boundary_hits[bisect_right(text_starts, start) - 1]
+            if hits.get(keyword_lower):
+                continue
+            hits[keyword_lower] = _has_word_boundary(buffer, start, end_index + 1)
+        
+        return [self._ordered_hits(hits) for hits in boundary_hits]
+
+    def _ordered_hits(self, boundary_hits):
+        found = []
+        for keyword_lower, has_boundary in boundary_hits.items():
+            for index, keyword in self._entries[keyword_lower]:
+                found.append((index, keyword, keyword_lower, has_boundary))
+        found.sort()
+        return [(keyword, keyword_lower, has_boundary) for _, keyword, keyword_lower, has_boundary in found]
+
+def enhanced_keyword_matching(text, keywords, text_lower=None, keyword_hits=None):
     """
     PRODUCTION-READY Enhanced keyword matching system with sophisticated filtering
     Based on extensive testing with real stock database keywords (Nov 8, 2025)
@@ -209,7 +409,11 @@ def enhanced_keyword_matching(text, keywords):
     
     Args:
         text (str): Text to search in (title + content combined)
-        keywords (list): List of keywords/symbols to search for
+        keywords (list | KeywordMatcher): Keywords/symbols to search for. Pass a
+            KeywordMatcher when matching many articles against the same keywords.
+        text_lower (str, optional): text.lower(), if the caller already has it
+        keyword_hits (list, optional): This text's entry from KeywordMatcher.scan_many,
+            when a batch of texts was scanned together
         
     Returns:
         tuple: (bool, list) - (is_match, list_of_matched_keywords)
@@ -217,46 +421,35 @@ def enhanced_keyword_matching(text, keywords):
     if not text or not keywords:
         return False, []
     
-    text_lower = text.lower()
+    matcher = KeywordMatcher.of(keywords)
+    if text_lower is None:
+        text_lower = text.lower()
     matched_keywords = []
     
-    # Common stopwords and noise terms to filter out for short keywords
-    stopwords = {
-        'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'up', 'about',
-        'into', 'through', 'during', 'before', 'after', 'above', 'below', 'between',
-        'among', 'through', 'the', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
-        'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'should', 'could', 'can', 'may', 'might', 'must', 'shall'
-    }
+    # Scan for financial indicators once and reuse it for every keyword's context check
+    indicator_scan = _scan_financial_indicators(text_lower)
+    is_dense, indicator_spans, _ = indicator_scan
     
-    for keyword in keywords:
-        if not keyword or len(keyword.strip()) == 0:
-            continue
-            
-        keyword = keyword.strip()
-        keyword_lower = keyword.lower()
-        
-        # Filter out very short keywords (≤2 characters) - too prone to false positives
-        if len(keyword) <= 2:
-            continue
-        
-        # Skip if keyword is a common stopword
-        if keyword_lower in stopwords:
-            continue
-        
+    # Only keywords that occur somewhere in the text are considered below
+    # (stopwords and ≤2 char keywords are already dropped by the matcher).
+    # With no financial indicator at all only company-name keywords can match,
+    # so the rest of the keyword list is not scanned for.
+    if keyword_hits is None:
+        keyword_hits = matcher.scan(text_lower, context_free_only=not is_dense and not indicator_spans)
+    if not keyword_hits:
+        return False, []
+    
+    for keyword, keyword_lower, has_boundary_match in keyword_hits:
         # Different matching strategies based on keyword length
         is_match = False
         
         if len(keyword) <= 4:
             # SHORT KEYWORDS (3-4 chars): Strict word boundary matching
             # Use word boundaries to prevent partial matches
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            matches = re.findall(pattern, text_lower)
-            
-            if matches:
+            if has_boundary_match:
                 # Additional validation: ensure it's in financial context
                 # For very short keywords, be extra strict about financial context
-                if is_financially_relevant_context(text, keyword):
+                if is_financially_relevant_context(text_lower, keyword_lower, indicator_scan):
                     # Extra check: make sure the keyword itself or nearby context is financial
                     # Look for keyword in proximity to financial terms (stricter for short keywords)
                     context_around_keyword = ""
@@ -267,91 +460,71 @@ def enhanced_keyword_matching(text, keywords):
                         context_around_keyword = text_lower[start:end]
                         
                         # Check if financial terms are very close to the keyword
-                        financial_terms_nearby = [
-                            'stock', 'share', 'market', 'trading', 'profit', 'loss', 'revenue',
-                            'earnings', 'dividend', 'company', 'business', 'financial', 'bank',
-                            'investment', 'fund', 'rupee', '₹', '%', 'crore', 'lakh'
-                        ]
-                        
-                        has_nearby_financial_terms = any(term in context_around_keyword for term in financial_terms_nearby)
-                        if has_nearby_financial_terms:
+                        # (one automaton pass, stopping at the first term found)
+                        for _ in NEARBY_FINANCIAL_TERM_AUTOMATON.iter(context_around_keyword):
                             is_match = True
+                            break
                     
         elif len(keyword) <= 8:
             # MEDIUM KEYWORDS (5-8 chars): Flexible matching with boundary preference
             # Try word boundary first, then substring if in financial context
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            matches = re.findall(pattern, text_lower)
-            
-            if matches:
+            if has_boundary_match:
                 # For company names, be more lenient
-                if any(company_indicator in keyword_lower for company_indicator in 
-                       ['industries', 'bank', 'limited', 'ltd', 'corp', 'company', 'group']):
+                if any(company_indicator in keyword_lower for company_indicator in COMPANY_NAME_INDICATORS):
                     is_match = True
-                elif is_financially_relevant_context(text, keyword):
+                elif is_financially_relevant_context(text_lower, keyword_lower, indicator_scan):
                     is_match = True
-            elif keyword_lower in text_lower:
+            else:
                 # Substring match, but require strong financial context
-                if is_financially_relevant_context(text, keyword):
+                if is_financially_relevant_context(text_lower, keyword_lower, indicator_scan):
                     is_match = True
                     
         else:
             # LONG KEYWORDS (9+ chars): Context-based substring matching
             # For longer keywords, substring matching is usually safe
-            if keyword_lower in text_lower:
-                # For company names and longer terms, be more lenient
-                if any(company_indicator in keyword_lower for company_indicator in 
-                       ['industries', 'bank', 'limited', 'ltd', 'corp', 'company', 'group', 'technologies']):
-                    is_match = True
-                elif is_financially_relevant_context(text, keyword):
-                    is_match = True
+            # For company names and longer terms, be more lenient
+            if any(company_indicator in keyword_lower for company_indicator in LONG_COMPANY_NAME_INDICATORS):
+                is_match = True
+            elif is_financially_relevant_context(text_lower, keyword_lower, indicator_scan):
+                is_match = True
         
         if is_match:
             matched_keywords.append(keyword)
     
     return len(matched_keywords) > 0, matched_keywords
 
-def extract_article_content(page, url):
+# Common article body selectors, tried in order
+ARTICLE_CONTENT_SELECTORS = [
+    'article', '.article-content', '.story-content', '.post-content',
+    '.content', '.main-content', '[data-module="ArticleBody"]',
+    '.field-body', '.entry-content', '.articleBody'
+]
+
+# Returns [document title, body text] in a single evaluate call. The first selector whose
+# text is over 100 characters wins, otherwise the last one found, otherwise the meta description.
+ARTICLE_CONTENT_JS = """selectors => {
+    let content = '';
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (!element) continue;
+        content = element.innerText;
+        if (content && content.trim().length > 100) break;
+    }
+    if (!content) {
+        const meta = document.querySelector('meta[name="description"]');
+        content = (meta && meta.getAttribute('content')) || '';
+    }
+    return [document.title || '', content || ''];
+}"""
+
+async def extract_article_content(page, url):
     """Extract article content from a webpage"""
     try:
         # Wait for content to load
-        page.wait_for_timeout(2000)
-        
-        # Try different content selectors based on the website
-        content = ""
-        title = ""
-        
-        # Try to get page title
-        try:
-            title = page.title() or ""
-        except:
-            title = ""
-        
-        # Extract content based on common article selectors
-        content_selectors = [
-            'article', '.article-content', '.story-content', '.post-content',
-            '.content', '.main-content', '[data-module="ArticleBody"]',
-            '.field-body', '.entry-content', '.articleBody'
-        ]
-        
-        for selector in content_selectors:
-            try:
-                elements = page.locator(selector)
-                if elements.count() > 0:
-                    content = elements.first().inner_text()
-                    if content and len(content.strip()) > 100:
-                        break
-            except:
-                continue
+        await page.wait_for_timeout(2000)
         
-        # If no content found, try meta description
-        if not content:
-            try:
-                meta_desc = page.locator('meta[name="description"]').get_attribute('content')
-                if meta_desc:
-                    content = meta_desc
-            except:
-                pass
+        # Walk the content selectors in the page itself instead of a round-trip per selector
+        title, content = await page.evaluate(ARTICLE_CONTENT_JS, ARTICLE_CONTENT_SELECTORS)
         
         # Clean the content
         if content:
@@ -390,54 +563,151 @@ def get_stock_keywords():
             'Reliance', 'HDFC', 'TCS', 'Infosys', 'Wipro'
         ]
 
-def scrape_economictimes_news(keywords=None, limit=10):
+# Yahoo article pages loaded at once; kept low to stay polite to the site
+YAHOO_ARTICLE_CONCURRENCY = 8
+# Landing-page titles shorter than this that fail matching get their article body checked too
+YAHOO_BODY_FETCH_MAX_TITLE_CHARS = 60
+
+# Playwright's own default, restored on pages handed back out by the pool
+DEFAULT_PAGE_TIMEOUT_MS = 30000
+
+# Only titles, links and text are read, so none of these need to be downloaded
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media', 'websocket'})
+BLOCKED_AD_HOSTS = ('doubleclick.net', 'googlesyndication.com')
+
+async def _block_unneeded_requests(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_AD_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class BrowserPool:
+    """
+    Launches each browser engine at most once and lends out pages from it, so the
+    scrapers share browser startup instead of each launching their own.
+    Use as an async context manager; everything is closed on exit. Safe to share
+    between scrapers running concurrently on the same event loop.
+    """
+
+    def __init__(self, max_idle_pages=YAHOO_ARTICLE_CONCURRENCY):
+        self.max_idle_pages = max_idle_pages
+        self._playwright = None
+        self._browsers = {}
+        self._idle_pages = {}
+        self._launch_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self._playwright = await async_playwright().start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        self._idle_pages.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _browser(self, engine):
+        # Lock so two scrapers asking for the same engine don't both launch it
+        async with self._launch_lock:
+            if engine not in self._browsers:
+                self._browsers[engine] = await getattr(self._playwright, engine).launch(headless=True)
+                self._idle_pages[engine] = []
+        return self._browsers[engine]
+
+    @asynccontextmanager
+    async def acquire(self, engine="firefox"):
+        """Lend a page from the given browser engine, reusing an idle one when possible"""
+        browser = await self._browser(engine)
+        idle_pages = self._idle_pages[engine]
+        if idle_pages:
+            page = idle_pages.pop()
+        else:
+            page = await browser.new_page()
+            await page.route("**/*", _block_unneeded_requests)
+        # Undo any timeout a previous borrower set
+        page.set_default_timeout(DEFAULT_PAGE_TIMEOUT_MS)
+        try:
+            yield page
+        finally:
+            if len(idle_pages) < self.max_idle_pages and not page.is_closed():
+                idle_pages.append(page)
+            else:
+                await page.close()
+
+@asynccontextmanager
+async def _browser_pool(pool=None):
+    """Use the caller's pool, or run with a private one that is closed afterwards"""
+    if pool is not None:
+        yield pool
+        return
+    async with BrowserPool() as own_pool:
+        yield own_pool
+
+# Returns [trimmed innerText, href] for the first `max` matched anchors in a single evaluate call
+ANCHOR_ROWS_JS = """(elements, max) => elements.slice(0, max).map(
+    el => [(el.innerText || '').trim(), el.getAttribute('href')]
+)"""
+
+async def scrape_economictimes_news_async(keywords=None, limit=10, pool=None):
     """Enhanced Economic Times scraper with keyword matching and content extraction"""
     url = "https://economictimes.indiatimes.com/news/latest-news"
     data = []
+    seen_articles = set()
     processed_count = 0
     relevant_count = 0
     
     logging.info(f"Starting Economic Times scraping with {len(keywords) if keywords else 0} keywords, limit: {limit}")
     
-    with sync_playwright() as p:
-        browser = p.firefox.launch(headless=True)
-        page = browser.new_page()
+    # Build the keyword automaton once for every article on the page
+    if keywords:
+        keywords = KeywordMatcher.of(keywords)
+    
+    async with _browser_pool(pool) as browser_pool, browser_pool.acquire("firefox") as page:
         
         try:
-            page.goto(url, timeout=60000)
+            await page.goto(url, timeout=60000)
+            page.set_default_timeout(5000)  # 5 second timeout for elements
             # Select all news article links in the main news list
             articles = page.locator("a[href*='/articleshow/']")
             
-            # Get article count with timeout handling
+            # Read titles and links of the first articles in one round-trip (fewer to avoid timeouts)
             try:
-                article_count = articles.count()
-                count = min(article_count, limit * 2)  # Get fewer articles to avoid timeouts
+                rows = await articles.evaluate_all(ANCHOR_ROWS_JS, limit * 2)
             except Exception as e:
-                logging.warning(f"Could not get article count: {e}")
-                count = limit
+                logging.warning(f"Could not read article links: {e}")
+                rows = []
+            
+            # Clean every headline up front so their keywords are found in one batched scan
+            rows = [(clean_time_references(clean_html_content(title)), link) for title, link in rows]
+            batch_hits = keywords.scan_many([title.lower() if title else "" for title, _ in rows]) if keywords else None
             
-            for i in range(count):
+            for i, (title, link) in enumerate(rows):
                 if len(data) >= limit:
                     break
                     
                 try:
-                    # Add timeout for each article
-                    page.set_default_timeout(5000)  # 5 second timeout for elements
-                    
-                    title = articles.nth(i).inner_text().strip()
-                    link = articles.nth(i).get_attribute("href")
-                    
                     if not link or not title:
                         continue
                         
                     if not link.startswith("http"):
                         link = "https://economictimes.indiatimes.com" + link
                     
-                    processed_count += 1
+                    # The same headline is often linked more than once on a page
+                    if (title, link) in seen_articles:
+                        continue
+                    seen_articles.add((title, link))
                     
-                    # Clean title
-                    title = clean_html_content(title)
-                    title = clean_time_references(title)
+                    processed_count += 1
                     
                     # Log the title for debugging
                     logging.debug(f"Processing article: {title}")
@@ -448,13 +718,16 @@ def scrape_economictimes_news(keywords=None, limit=10):
                     
                     # Use title for keyword matching (faster and often sufficient)
                     text_for_matching = final_title
+                    # Lowercased once and shared by the keyword match and its fallback
+                    text_for_matching_lower = text_for_matching.lower()
                     
                     # Apply keyword matching if keywords provided
                     if keywords:
-                        is_relevant, matched_keywords = enhanced_keyword_matching(text_for_matching, keywords)
+                        is_relevant, matched_keywords = enhanced_keyword_matching(
+                            text_for_matching, keywords, text_for_matching_lower, batch_hits[i])
                         if not is_relevant:
                             # Also try basic financial relevance as fallback
-                            if is_financially_relevant_context(text_for_matching, ""):
+                            if is_financially_relevant_context(text_for_matching_lower, ""):
                                 # If it's financially relevant but no keywords matched, add it anyway
                                 matched_keywords = ["financial_context"]
                                 is_relevant = True
@@ -466,14 +739,14 @@ def scrape_economictimes_news(keywords=None, limit=10):
                             logging.debug(f"Article matched keywords {matched_keywords}: {final_title[:50]}...")
                     else:
                         # If no keywords provided, apply basic financial relevance check
-                        if not is_financially_relevant_context(text_for_matching, ""):
+                        if not is_financially_relevant_context(text_for_matching_lower, ""):
                             continue
                         matched_keywords = []
                     
                     relevant_count += 1
                     
                     # Create fingerprint for duplicate detection
-                    fingerprint = sha256(f"{final_title}{link}".encode()).hexdigest()
+                    fingerprint = article_fingerprint(final_title, link)
                     
                     article_data = {
                         "source": "economictimes",
@@ -494,59 +767,58 @@ def scrape_economictimes_news(keywords=None, limit=10):
                     
         except Exception as e:
             logging.error(f"Error scraping Economic Times: {e}")
-        finally:
-            try:
-                browser.close()
-            except:
-                pass
     
     logging.info(f"Economic Times: Processed {processed_count} articles, found {relevant_count} relevant, returning {len(data)}")
     return data
 
-def scrape_livemint_news(keywords=None, limit=10):
+async def scrape_livemint_news_async(keywords=None, limit=10, pool=None):
     """Enhanced LiveMint scraper with keyword matching and optimized performance"""
     url = "https://www.livemint.com/market/stock-market-news"
     data = []
+    seen_articles = set()
     processed_count = 0
     relevant_count = 0
     
     logging.info(f"Starting LiveMint scraping with {len(keywords) if keywords else 0} keywords, limit: {limit}")
     
-    with sync_playwright() as p:
-        browser = p.firefox.launch(headless=True)
-        page = browser.new_page()
+    # Build the keyword automaton once for every article on the page
+    if keywords:
+        keywords = KeywordMatcher.of(keywords)
+    
+    async with _browser_pool(pool) as browser_pool, browser_pool.acquire("firefox") as page:
         
         try:
-            page.goto(url, timeout=60000)
+            await page.goto(url, timeout=60000)
             page.set_default_timeout(5000)  # 5 second timeout
             articles = page.locator(".headline a")
             
             try:
-                article_count = articles.count()
-                count = min(article_count, limit * 2)
+                rows = await articles.evaluate_all(ANCHOR_ROWS_JS, limit * 2)
             except Exception as e:
-                logging.warning(f"Could not get article count: {e}")
-                count = limit
+                logging.warning(f"Could not read article links: {e}")
+                rows = []
             
-            for i in range(count):
+            # Clean every headline up front so their keywords are found in one batched scan
+            rows = [(clean_time_references(clean_html_content(title)), link) for title, link in rows]
+            batch_hits = keywords.scan_many([title.lower() if title else "" for title, _ in rows]) if keywords else None
+            
+            for i, (title, link) in enumerate(rows):
                 if len(data) >= limit:
                     break
                     
                 try:
-                    title = articles.nth(i).inner_text().strip()
-                    link = articles.nth(i).get_attribute("href")
-                    
                     if not link or not title:
                         continue
                         
                     if not link.startswith("http"):
                         link = "https://www.livemint.com" + link
                     
-                    processed_count += 1
+                    # The same headline is often linked more than once on a page
+                    if (title, link) in seen_articles:
+                        continue
+                    seen_articles.add((title, link))
                     
-                    # Clean title
-                    title = clean_html_content(title)
-                    title = clean_time_references(title)
+                    processed_count += 1
                     
                     # Use title only for faster processing
                     final_title = title
@@ -555,19 +827,19 @@ def scrape_livemint_news(keywords=None, limit=10):
                     
                     # Apply keyword matching if keywords provided
                     if keywords:
-                        is_relevant, matched_keywords = enhanced_keyword_matching(text_for_matching, keywords)
+                        is_relevant, matched_keywords = enhanced_keyword_matching(text_for_matching, keywords, keyword_hits=batch_hits[i])
                         if not is_relevant:
                             continue
                     else:
                         # If no keywords provided, apply basic financial relevance check
-                        if not is_financially_relevant_context(text_for_matching, ""):
+                        if not is_financially_relevant_context(text_for_matching.lower(), ""):
                             continue
                         matched_keywords = []
                     
                     relevant_count += 1
                     
                     # Create fingerprint for duplicate detection
-                    fingerprint = sha256(f"{final_title}{link}".encode()).hexdigest()
+                    fingerprint = article_fingerprint(final_title, link)
                     
                     article_data = {
                         "source": "livemint",
@@ -588,16 +860,11 @@ def scrape_livemint_news(keywords=None, limit=10):
                     
         except Exception as e:
             logging.error(f"Error scraping LiveMint: {e}")
-        finally:
-            try:
-                browser.close()
-            except:
-                pass
     
     logging.info(f"LiveMint: Processed {processed_count} articles, found {relevant_count} relevant, returning {len(data)}")
     return data
 
-def scrape_yahoo_finance_news(keywords=None, limit=10):
+async def scrape_yahoo_finance_news_async(keywords=None, limit=10, pool=None):
     """Enhanced Yahoo Finance scraper with keyword matching and content extraction"""
     url = "https://finance.yahoo.com/"
     data = []
@@ -607,22 +874,23 @@ def scrape_yahoo_finance_news(keywords=None, limit=10):
     
     logging.info(f"Starting Yahoo Finance scraping with {len(keywords) if keywords else 0} keywords, limit: {limit}")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    # Build the keyword automaton once for every article on the page
+    if keywords:
+        keywords = KeywordMatcher.of(keywords)
+    
+    async with _browser_pool(pool) as browser_pool, browser_pool.acquire("chromium") as page:
         
         try:
-            page.goto(url, timeout=120000)
-            page.wait_for_timeout(7000)
-            links = page.query_selector_all("a[href*='/news/']")
+            await page.goto(url, timeout=120000)
+            await page.wait_for_timeout(1500)
+            links = await page.query_selector_all("a[href*='/news/']")
             
+            # Collect candidate (title, link) pairs from the landing page
+            candidates = []
             for a in links:
-                if len(data) >= limit:
-                    break
-                    
                 try:
-                    link = a.get_attribute("href")
-                    title = a.inner_text().strip()
+                    link = await a.get_attribute("href")
+                    title = (await a.inner_text()).strip()
                     
                     # Normalize link
                     if link and not link.startswith("http"):
@@ -639,78 +907,118 @@ def scrape_yahoo_finance_news(keywords=None, limit=10):
                         continue
                     
                     seen_urls.add(link)
-                    processed_count += 1
                     
                     # Clean title
                     title = clean_html_content(title)
                     title = clean_time_references(title)
+                    candidates.append((title, link))
                     
-                    # Extract article content
-                    content_title, content = "", ""
+                except Exception as e:
+                    logging.warning(f"Error reading link: {e}")
+                    continue
+            
+            def match_relevance(text):
+                # Apply keyword matching if keywords provided
+                if keywords:
+                    return enhanced_keyword_matching(text, keywords)
+                # If no keywords provided, apply basic financial relevance check
+                return is_financially_relevant_context(text.lower(), ""), []
+            
+            article_semaphore = asyncio.Semaphore(YAHOO_ARTICLE_CONCURRENCY)
+            
+            async def fetch_article(link):
+                async with article_semaphore:
                     try:
-                        # Navigate to article page
-                        article_page = browser.new_page()
-                        article_page.goto(link, timeout=30000)
-                        content_title, content = extract_article_content(article_page, link)
-                        article_page.close()
+                        # Navigate to article page on its own page from the pool
+                        async with browser_pool.acquire("chromium") as article_page:
+                            await article_page.goto(link, timeout=30000)
+                            return await extract_article_content(article_page, link)
                     except Exception as e:
                         logging.warning(f"Could not extract content from {link}: {e}")
+                        return "", ""
+            
+            # Work through candidates a batch at a time so we stop loading pages once the limit is met
+            for batch_start in range(0, len(candidates), YAHOO_ARTICLE_CONCURRENCY):
+                if len(data) >= limit:
+                    break
+                
+                batch = candidates[batch_start:batch_start + YAHOO_ARTICLE_CONCURRENCY]
+                
+                # Match on the landing-page title first; only short, unmatched titles
+                # are worth a page load to check the article body as well
+                title_matches = [match_relevance(title) for title, _ in batch]
+                body_links = [
+                    link for (title, link), (is_relevant, _) in zip(batch, title_matches)
+                    if not is_relevant and len(title) < YAHOO_BODY_FETCH_MAX_TITLE_CHARS
+                ]
+                bodies = dict(zip(body_links, await asyncio.gather(*(fetch_article(link) for link in body_links))))
+                
+                for (title, link), (is_relevant, matched_keywords) in zip(batch, title_matches):
+                    if len(data) >= limit:
+                        break
                     
-                    # Use article title if extracted title is empty
-                    final_title = content_title if content_title else title
-                    
-                    # Combine title and content for keyword matching
-                    text_for_matching = f"{final_title} {content}".strip()
-                    
-                    # Apply keyword matching if keywords provided
-                    if keywords:
-                        is_relevant, matched_keywords = enhanced_keyword_matching(text_for_matching, keywords)
+                    try:
+                        processed_count += 1
+                        
+                        content_title, content = bodies.get(link, ("", ""))
+                        
+                        # Use article title if extracted title is empty
+                        final_title = content_title if content_title else title
+                        
                         if not is_relevant:
-                            continue
-                    else:
-                        # If no keywords provided, apply basic financial relevance check
-                        if not is_financially_relevant_context(text_for_matching, ""):
-                            continue
-                        matched_keywords = []
-                    
-                    relevant_count += 1
-                    
-                    # Create fingerprint for duplicate detection
-                    fingerprint = sha256(f"{final_title}{link}".encode()).hexdigest()
-                    
-                    article_data = {
-                        "source": "yahoo_finance",
-                        "title": final_title,
-                        "content": content[:1000] if content else "",  # Limit content length
-                        "url": link,
-                        "fingerprint": fingerprint,
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                        "matched_keywords": matched_keywords,
-                        "original_title": title
-                    }
-                    
-                    data.append(article_data)
-                    
-                except Exception as e:
-                    logging.warning(f"Error processing article: {e}")
-                    continue
+                            if link not in bodies:
+                                continue
+                            
+                            # Combine title and content for keyword matching
+                            text_for_matching = f"{final_title} {content}".strip()
+                            is_relevant, matched_keywords = match_relevance(text_for_matching)
+                            if not is_relevant:
+                                continue
+                        
+                        relevant_count += 1
+                        
+                        # Create fingerprint for duplicate detection
+                        fingerprint = article_fingerprint(final_title, link)
+                        
+                        article_data = {
+                            "source": "yahoo_finance",
+                            "title": final_title,
+                            "content": content[:1000] if content else "",  # Limit content length
+                            "url": link,
+                            "fingerprint": fingerprint,
+                            "fetched_at": datetime.now(timezone.utc).isoformat(),
+                            "matched_keywords": matched_keywords,
+                            "original_title": title
+                        }
+                        
+                        data.append(article_data)
+                        
+                    except Exception as e:
+                        logging.warning(f"Error processing article: {e}")
+                        continue
                     
         except Exception as e:
             logging.error(f"Error scraping Yahoo Finance: {e}")
-        finally:
-            browser.close()
     
     logging.info(f"Yahoo Finance: Processed {processed_count} articles, found {relevant_count} relevant, returning {len(data)}")
     return data
 
-def match_keywords_to_symbols(keywords, stocks_data=None):
-    """Match keywords to stock symbols for database storage"""
+def scrape_economictimes_news(keywords=None, limit=10):
+    """Blocking wrapper around scrape_economictimes_news_async"""
+    return asyncio.run(scrape_economictimes_news_async(keywords=keywords, limit=limit))
+
+def scrape_livemint_news(keywords=None, limit=10):
+    """Blocking wrapper around scrape_livemint_news_async"""
+    return asyncio.run(scrape_livemint_news_async(keywords=keywords, limit=limit))
+
+def scrape_yahoo_finance_news(keywords=None, limit=10):
+    """Blocking wrapper around scrape_yahoo_finance_news_async"""
+    return asyncio.run(scrape_yahoo_finance_news_async(keywords=keywords, limit=limit))
+
+def build_symbol_map(stocks_data):
+    """Lowercased stock symbol/name/keyword -> yfin_symbol lookup used by SymbolMatcher"""
     symbol_map = {}
     
-    # Get stocks data from utility if not provided
-    if stocks_data is None:
-        stocks_data = fetch_stock_keywords()
-    
     # Create lookup maps from stocks data
     for stock in stocks_data:
         symbol = stock.get('yfin_symbol', '').upper()
@@ -723,25 +1031,92 @@ def match_keywords_to_symbols(keywords, stocks_data=None):
             # Add any additional keywords
             if stock.get('keyword_lst'):
                 if isinstance(stock['keyword_lst'], list):
-                    for keyword in stock['keyword_lst']:
-                        symbol_map[keyword.lower()] = symbol
-                elif isinstance(stock['keyword_lst'], str):
-                    for keyword in stock['keyword_lst'].split(','):
-                        symbol_map[keyword.strip().lower()] = symbol
-    
-    # Match keywords to symbols
-    matched_symbols = []
-    for keyword in keywords:
+                    stock_keywords = stock['keyword_lst']
+                else:
+                    # Stored as {"keyword": [...]} JSON, the same shape get_all_keywords reads
+                    stock_keywords = parse_keyword_json(stock['keyword_lst'])
+                for keyword in stock_keywords:
+                    symbol_map[keyword.strip().lower()] = symbol
+    
+    return symbol_map
+
+class SymbolMatcher:
+    """
+    Maps matched article keywords to stock symbols. Besides exact lookups, an
+    Aho-Corasick automaton over every known stock name/keyword finds names embedded
+    in longer keywords (e.g. "HDFC Bank Ltd" -> the "hdfc bank" stock).
+    Build once per batch of articles.
+    """
+
+    def __init__(self, stocks_data):
+        self.symbol_map = build_symbol_map(stocks_data)
+        self._automaton = ahocorasick.Automaton()
+        for key in self.symbol_map:
+            if key:
+                self._automaton.add_word(key, key)
+        # Length range of the known names: anything outside it can't be a name
+        self._min_key_length = min((len(key) for key in self.symbol_map if key), default=0)
+        self._max_key_length = max((len(key) for key in self.symbol_map), default=0)
+        if self._min_key_length:
+            self._automaton.make_automaton()
+        self._keyword_cache = {}
+
+    def _keyword_symbols(self, keyword):
+        """(exact-match symbol or None, symbols of names inside the keyword), memoized"""
+        cached = self._keyword_cache.get(keyword)
+        if cached is not None:
+            return cached
+        
         keyword_lower = keyword.lower()
-        if keyword_lower in symbol_map:
-            symbol = symbol_map[keyword_lower]
-            if symbol not in matched_symbols:
-                matched_symbols.append(symbol)
+        exact_symbol = None
+        embedded_symbols = []
+        if self._min_key_length <= len(keyword_lower) <= self._max_key_length:
+            exact_symbol = self.symbol_map.get(keyword_lower)
+        # Stock names inside the keyword. Skipped when it is too short to hold a name.
+        if self._min_key_length and len(keyword_lower) >= self._min_key_length:
+            for end_index, key in self._automaton.iter(keyword_lower):
+                start = end_index - len(key) + 1
+                if not _has_word_boundary(keyword_lower, start, end_index + 1):
+                    continue
+                embedded_symbols.append(self.symbol_map[key])
+        
+        cached = self._keyword_cache[keyword] = (exact_symbol, embedded_symbols)
+        return cached
     
-    return matched_symbols
+    def match(self, keywords):
+        # Articles in a batch mostly share the same few matched keywords, so each
+        # distinct keyword is only looked up and scanned once per matcher
+        keyword_symbols = [self._keyword_symbols(keyword) for keyword in keywords]
+        
+        # dict keys as an insertion-ordered set: exact matches first, then embedded names
+        matched_symbols = {}
+        for exact_symbol, _ in keyword_symbols:
+            if exact_symbol is not None:
+                matched_symbols[exact_symbol] = None
+        for _, embedded_symbols in keyword_symbols:
+            matched_symbols.update(dict.fromkeys(embedded_symbols))
+        
+        return list(matched_symbols)
+
+def match_keywords_to_symbols(keywords, stocks_data=None, symbol_matcher=None):
+    """
+    Match keywords to stock symbols for database storage.
+    Pass a SymbolMatcher when matching many articles.
+    """
+    if symbol_matcher is None:
+        # Get stocks data from utility if not provided
+        if stocks_data is None:
+            stocks_data = fetch_stock_keywords()
+        symbol_matcher = SymbolMatcher(stocks_data)
+    
+    return symbol_matcher.match(keywords)
 
 def process_and_store_articles(articles, stocks_data=None):
-    """Process articles and store them in database with duplicate checking"""
+    """
+    Process articles and store them in database with duplicate checking.
+    An article matching several stocks is stored once per stock symbol; the returned
+    counts are of those per-symbol rows.
+    """
     stored_count = 0
     duplicate_count = 0
     error_count = 0
@@ -750,45 +1125,113 @@ def process_and_store_articles(articles, stocks_data=None):
     if stocks_data is None:
         stocks_data = fetch_stock_keywords()
     
+    # Built once for the whole batch rather than for every article
+    symbol_matcher = SymbolMatcher(stocks_data)
+    
+    # Prepare every article first so the duplicate check and the insert can each
+    # be done for the whole batch in one round-trip
+    prepared = []
     for article in articles:
         try:
             # Match keywords to stock symbols first to get yfin_symbol
             matched_keywords = article.get('matched_keywords', [])
-            symbols = match_keywords_to_symbols(matched_keywords, stocks_data)
-            
-            # Get primary symbol for duplicate checking
-            primary_symbol = symbols[0] if symbols else 'UNKNOWN'
+            symbols = match_keywords_to_symbols(matched_keywords, symbol_matcher=symbol_matcher)
             
-            # Check if article already exists using proper parameters
-            if check_existing_news(article['title'], article.get('published_at', ''), primary_symbol):
-                duplicate_count += 1
-                logging.debug(f"Duplicate article skipped: {article['title'][:50]}...")
-                continue
+            # One row per matched symbol, so the article shows up under every stock it
+            # mentions and duplicates are checked per (title, symbol)
+            for symbol in symbols or ['UNKNOWN']:
+                # Prepare article data for storage (only fields that exist in database)
+                article_data = {
+                    'title': article['title'],
+                    'content': article.get('content', ''),
+                    'url': article['url'],
+                    'source': article['source'],
+                    'yfin_symbol': symbol,
+                    'published_at': article.get('published_at', article['fetched_at'])
+                }
+                prepared.append((article_data, symbols))
             
-            # Prepare article data for storage (only fields that exist in database)
-            article_data = {
-                'title': article['title'],
-                'content': article.get('content', ''),
-                'url': article['url'],
-                'source': article['source'],
-                'yfin_symbol': primary_symbol,
-                'published_at': article.get('published_at', article['fetched_at'])
-            }
-            
-            # Store article
-            if store_news_article(article_data):
-                stored_count += 1
-                logging.info(f"Stored article: {article['title'][:50]}... (symbols: {', '.join(symbols)})")
-            else:
-                error_count += 1
-                logging.warning(f"Failed to store article: {article['title'][:50]}...")
-                
         except Exception as e:
             error_count += 1
             logging.error(f"Error processing article {article.get('title', '')}: {e}")
     
+    # Check which articles already exist, in bulk; without that answer nothing is stored
+    try:
+        existing = find_existing_news([(article_data['title'], article_data['yfin_symbol']) for article_data, _ in prepared])
+    except Exception as e:
+        error_count += len(prepared)
+        logging.error(f"Error checking for existing articles, skipping {len(prepared)} articles: {e}")
+        return stored_count, duplicate_count, error_count
+    
+    # Per-article messages are only formatted when debug logging is actually on
+    log_each_article = logging.getLogger().isEnabledFor(logging.DEBUG)
+    
+    to_store = []
+    queued = set()
+    for article_data, symbols in prepared:
+        key = (article_data['title'], article_data['yfin_symbol'])
+        # Also catch the same article turning up twice in this batch
+        if key in existing or key in queued:
+            duplicate_count += 1
+            if log_each_article:
+                logging.debug(f"Duplicate article skipped: {article_data['title'][:50]}...")
+            continue
+        queued.add(key)
+        to_store.append((article_data, symbols))
+    
+    # Store articles
+    if to_store:
+        stored_count = store_news_articles([article_data for article_data, _ in to_store])
+        if stored_count == len(to_store):
+            if log_each_article:
+                for article_data, symbols in to_store:
+                    logging.debug(f"Stored article: {article_data['title'][:50]}... (symbols: {', '.join(symbols)})")
+            stored_symbols = dict.fromkeys(article_data['yfin_symbol'] for article_data, _ in to_store)
+            logging.info(f"Stored {stored_count} articles (symbols: {', '.join(stored_symbols)})")
+        else:
+            error_count += len(to_store) - stored_count
+            logging.warning(f"Failed to store {len(to_store) - stored_count} of {len(to_store)} articles")
+    
     return stored_count, duplicate_count, error_count
 
+async def _scrape_source(source_name, scraper_func, keywords, limit, pool):
+    """Run one scraper, returning (articles, source statistics) without raising"""
+    source_start_time = datetime.now(timezone.utc)
+    
+    try:
+        logging.info(f"Starting {source_name} scraper...")
+        source_articles = await scraper_func(keywords=keywords, limit=limit, pool=pool)
+        logging.info(f"Completed {source_name}: {len(source_articles)} articles")
+        
+        return source_articles, {
+            'scraped_count': len(source_articles),
+            'execution_time': (datetime.now(timezone.utc) - source_start_time).total_seconds(),
+            'status': 'success'
+        }
+        
+    except Exception as e:
+        logging.error(f"Error in {source_name} scraper: {e}")
+        return [], {
+            'scraped_count': 0,
+            'execution_time': (datetime.now(timezone.utc) - source_start_time).total_seconds(),
+            'status': 'error',
+            'error': str(e)
+        }
+
+async def _scrape_all_sources(scrapers, keywords, limit):
+    """
+    Run all scrapers concurrently on one shared browser pool, loading the stocks data
+    used for symbol matching in a worker thread meanwhile.
+    Returns (per-source results, stocks_data).
+    """
+    stocks_data_task = asyncio.create_task(asyncio.to_thread(fetch_stock_keywords))
+    async with BrowserPool() as browser_pool:
+        results = await asyncio.gather(*(
+            _scrape_source(source_name, scraper_func, keywords, limit, browser_pool)
+            for source_name, scraper_func in scrapers
+        ))
+    return results, await stocks_data_task
+
 def run_all_scrapers(keywords=None, limit_per_source=10):
     """
     PRODUCTION-READY Enhanced Multi-Source Financial News Scraper
@@ -814,9 +1257,6 @@ def run_all_scrapers(keywords=None, limit_per_source=10):
     if keywords is None:
         keywords = get_stock_keywords()
     
-    # Get stocks data for symbol matching
-    stocks_data = fetch_stock_keywords()
-    
     logging.info(f"Starting enhanced multi-source scraping with {len(keywords)} keywords")
     logging.info(f"Target sources: Economic Times, LiveMint, Yahoo Finance")
     logging.info(f"Articles per source: {limit_per_source}")
@@ -834,40 +1274,23 @@ def run_all_scrapers(keywords=None, limit_per_source=10):
         'execution_time_seconds': 0
     }
     
-    # Scrape from all sources
+    # Scrape from all sources concurrently
     scrapers = [
-        ('economictimes', scrape_economictimes_news),
-        ('livemint', scrape_livemint_news),
-        ('yahoo_finance', scrape_yahoo_finance_news)
+        ('economictimes', scrape_economictimes_news_async),
+        ('livemint', scrape_livemint_news_async),
+        ('yahoo_finance', scrape_yahoo_finance_news_async)
     ]
     
-    all_articles = []
+    # Index the keywords once and share the automaton across all sources
+    keyword_matcher = KeywordMatcher(keywords)
     
-    for source_name, scraper_func in scrapers:
-        source_start_time = datetime.now(timezone.utc)
-        
-        try:
-            logging.info(f"Starting {source_name} scraper...")
-            source_articles = scraper_func(keywords=keywords, limit=limit_per_source)
-            all_articles.extend(source_articles)
-            
-            # Update source statistics
-            stats['sources'][source_name] = {
-                'scraped_count': len(source_articles),
-                'execution_time': (datetime.now(timezone.utc) - source_start_time).total_seconds(),
-                'status': 'success'
-            }
-            
-            logging.info(f"Completed {source_name}: {len(source_articles)} articles")
-            
-        except Exception as e:
-            logging.error(f"Error in {source_name} scraper: {e}")
-            stats['sources'][source_name] = {
-                'scraped_count': 0,
-                'execution_time': (datetime.now(timezone.utc) - source_start_time).total_seconds(),
-                'status': 'error',
-                'error': str(e)
-            }
+    # Stocks data for symbol matching is fetched alongside the scraping
+    results, stocks_data = asyncio.run(_scrape_all_sources(scrapers, keyword_matcher, limit_per_source))
+    
+    all_articles = []
+    for source_name, (source_articles, source_stats) in zip((name for name, _ in scrapers), results):
+        all_articles.extend(source_articles)
+        stats['sources'][source_name] = source_stats
     
     # Update total scraped count
     stats['total_scraped'] = len(all_articles)
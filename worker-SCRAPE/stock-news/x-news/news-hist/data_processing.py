@@ -1,28 +1,24 @@
 import pandas as pd
-from datetime import datetime
-import pytz
 
 # Load your CSV
 df = pd.read_csv("matched_news.csv")  # Replace with your actual filename
 
-# Assume the column with dates is named 'raw_date'
-def convert_to_timestamp(date_str):
-    print(type(date_str), date_str)
-    try:
-        # Remove the weekday part
-        cleaned = ','.join(date_str.split(',')[:2]).strip()
-        # Parse to datetime
-        dt = datetime.strptime(cleaned, "%B %d, %Y")
-        # Add default time and convert to UTC
-        dt = dt.replace(hour=16, minute=28, second=0)
-        dt_utc = dt.astimezone(pytz.UTC)
-        return dt_utc.isoformat()
-    except Exception as e:
-        print(f"Error parsing '{date_str}': {e}")
-        return None
+# Dates look like "March 18, 2020, Wednesday"; the articles carry no time, so they are
+# stamped 16:28 Indian time (what the row-by-row version produced on an IST machine)
+def convert_to_timestamps(dates):
+    # Remove the weekday part
+    cleaned = dates.str.split(',').str[:2].str.join(',').str.strip()
+    # Parse to datetime; unparseable dates become NaT
+    dt = pd.to_datetime(cleaned, format="%B %d, %Y", errors="coerce")
+    # Add default time and convert to UTC
+    dt = (dt + pd.Timedelta(hours=16, minutes=28)).dt.tz_localize("Asia/Kolkata").dt.tz_convert("UTC")
+    failed = dt.isna() & dates.notna()
+    if failed.any():
+        print(f"Could not parse {failed.sum()} dates, e.g. {dates[failed].iloc[0]!r}")
+    return dt.dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
 # Apply conversion
-df["scraped_at"] = df["Date"].apply(convert_to_timestamp)
+df["scraped_at"] = convert_to_timestamps(df["Date"])
 
 # Save to new CSV
-df.to_csv("converted_dates.csv", index=False)
\ No newline at end of file
+df.to_csv("converted_dates.csv", index=False, chunksize=100_000)
@@ -1,10 +1,21 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
-from datetime import datetime
+import orjson
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import feedparser
 import html
+import ahocorasick
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+import threading
+from dateutil import parser as date_parser
  
 import logging
 import re
@@ -12,10 +23,12 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent / 'utilities'))
 from utilities.load_keywords_scrape import fetch_stock_keywords
-from utilities.check_existing_news import check_existing_news
-from utilities.store_news_article import store_news_article
+from utilities.check_existing_news import find_existing_news
+from utilities.store_news_article import store_news_articles
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # Fallback Google News URL (now secondary option)
 GOOGLE_NEWS_URL = f"https://news.google.com/search?q={{stock}}+finance+india+{{date}}&hl=en-IN&gl=IN&ceid=IN:en"
 
@@ -34,68 +47,205 @@ RSS_SOURCES = {
     "Reuters India Business": "https://feeds.reuters.com/reuters/INbusinessNews",
     "CNBC TV18": "https://www.cnbctv18.com/rss/market.xml"
 }
+# Feeds are downloaded in parallel; each request has its own timeout
+RSS_FETCH_WORKERS = 8
+RSS_FETCH_TIMEOUT_SECONDS = 10
+RSS_CONNECT_TIMEOUT_SECONDS = 3
+# Stocks matched and stored at the same time (each one waits mostly on Google News and Supabase)
+STOCK_WORKERS = 8
+
+def _build_rss_session():
+    """HTTP session for the feeds: keeps connections to each news site alive between
+    requests (several feeds share a host) and retries transient failures twice"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=RSS_FETCH_WORKERS,
+                          max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    return session
+
+RSS_SESSION = _build_rss_session()
+
+# Financial context indicators
+FINANCIAL_INDICATORS = frozenset((
+    # Market/Trading terms
+    'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
+    'nifty', 'sensex', 'bse', 'nse', 'equity', 'mutual fund', 'ipo', 'listing',
+
+    # Financial performance
+    'profit', 'loss', 'revenue', 'earnings', 'dividend', 'buyback', 'results',
+    'quarter', 'q1', 'q2', 'q3', 'q4', 'financial year', 'fy', 'annual',
+
+    # Business operations
+    'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
+    'management', 'board', 'ceo', 'cfo', 'chairman', 'director',
+
+    # Economic indicators
+    'economy', 'economic', 'gdp', 'inflation', 'rbi', 'sebi', 'rupee',
+    'currency', 'fiscal', 'budget', 'policy', 'rate', 'bank', 'banking',
+
+    # Investment terms
+    'fund', 'capital', 'debt', 'credit', 'loan', 'finance', 'financial',
+    'valuation', 'price', 'value', 'worth', 'cost', 'expense',
+
+    # Market sentiment
+    'bullish', 'bearish', 'rally', 'correction', 'volatile', 'trend',
+    'growth', 'decline', 'surge', 'drop', 'gain', 'fall'
+))
+
+# Stock/finance keywords to filter relevant articles
+FINANCE_KEYWORDS = frozenset((
+    'stock', 'market', 'share', 'nifty', 'sensex', 'bse', 'nse',
+    'equity', 'trading', 'investment', 'profit', 'loss', 'earning',
+    'revenue', 'financial', 'rupee', 'currency', 'economy',
+    'fund', 'ipo', 'dividend', 'quarter', 'q1', 'q2', 'q3', 'q4',
+    'fiscal', 'budget', 'inflation', 'gdp', 'rbi', 'sebi',
+    'mutual fund', 'portfolio', 'bullish', 'bearish', 'buyback'
+))
+
+def build_keyword_automaton(keywords_lower):
+    """
+    Aho-Corasick automaton over lowercased keywords; iterating it over a text yields
+    (end index, keyword) for every occurrence in one pass. None if there are no keywords.
+    """
+    keywords_lower = {keyword for keyword in keywords_lower if keyword}
+    if not keywords_lower:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords_lower:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def contains_any(automaton, text_lower):
+    """True if any keyword of the automaton occurs in text_lower"""
+    return automaton is not None and next(automaton.iter(text_lower), None) is not None
+
+FINANCIAL_INDICATOR_AUTOMATON = build_keyword_automaton(FINANCIAL_INDICATORS)
+FINANCE_KEYWORD_AUTOMATON = build_keyword_automaton(FINANCE_KEYWORDS)
+
+# Patterns used by clean_html_content, compiled once
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+# Script/style elements, whose text is not article content
+SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Time references stripped by clean_time_references, applied one after another in this order
+TIME_REFERENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b\d+\s*(hour|hours|hr|hrs|minute|minutes|min|mins)\s*ago\b',
+    r'\b(today|yesterday|earlier today|this morning|this evening)\b',
+    r'\b\d+\s*days?\s*ago\b',
+    r'\bLive:\s*',
+    r'\bBreaking:\s*',
+    r'\bUpdate:\s*',
+    r'\s*\d+\s*(minute|minutes|min|hour|hours|hr|day|days)\s*ago\s*',
+    r'\s*Yesterday\s*',
+    r'\s*Today\s*',
+    r'\s*\d+\s*(min|hr)\s*',
+    r'\s*\d+\s*(minute|minutes|hour|hours|day|days)\s*',
+    r'By\s+[A-Za-z\s]+$',  # Remove "By Author Name" at the end
+))
+# Text without any of these can't match a time reference, byline or trailing separator
+# pattern, so clean_time_references only has to normalize its whitespace
+TIME_REFERENCE_MARKERS_PATTERN = re.compile(
+    r'\d|[-|]|today|yesterday|this morning|this evening|live:|breaking:|update:|by', re.IGNORECASE
+)
+# Author bylines (patterns like "- Author Name" or "| Author Name" at the end)
+DASH_BYLINE_PATTERN = re.compile(r'\s*-\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$')
+PIPE_BYLINE_PATTERN = re.compile(r'\s*\|\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$')
+TRAILING_SEPARATOR_PATTERN = re.compile(r'\s*[-|]\s*$')
+# Separator between a Google News item's source and its title
+MORE_PATTERN = re.compile(r'more', re.IGNORECASE)
+LEADING_TIME_AGO_PATTERN = re.compile(r'^\d+\s*(minute|minutes|hour|hours|day|days)\s*ago\s*', re.IGNORECASE)
+
+def _is_word_char(char):
+    """Same definition of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+def find_all(text, word):
+    """Start offset of every occurrence of word in text, overlapping ones included"""
+    pos = text.find(word)
+    while pos != -1:
+        yield pos
+        pos = text.find(word, pos + 1)
+
+def keyword_positions(automaton, text_lower):
+    """Start offsets of every keyword of the automaton in text_lower, from a single pass"""
+    positions = {}
+    if automaton is not None:
+        for end, keyword in automaton.iter(text_lower):
+            positions.setdefault(keyword, []).append(end + 1 - len(keyword))
+    return positions
+
+def contains_word(text, word, positions=None):
+    """
+    True if word occurs in text delimited the way the regex \\b<word>\\b would require.
+    Checks the characters around each str.find hit instead of compiling a pattern per keyword.
+    positions: the word's start offsets in text, if already known.
+    """
+    starts_with_word_char = _is_word_char(word[0])
+    ends_with_word_char = _is_word_char(word[-1])
+    for pos in find_all(text, word) if positions is None else positions:
+        end = pos + len(word)
+        before_is_word = pos > 0 and _is_word_char(text[pos - 1])
+        after_is_word = end < len(text) and _is_word_char(text[end])
+        if before_is_word != starts_with_word_char and after_is_word != ends_with_word_char:
+            return True
+    return False
+
+def scan_financial_indicators(text_lower):
+    """
+    One automaton pass over text_lower, reusable for every keyword checked against it.
+    Returns (is_dense, indicator_spans, indicator_starts): is_dense is True once the
+    text holds at least 3 distinct indicators, in which case the scan stops early and
+    no spans are returned; otherwise the sorted (start, end) spans of every indicator
+    occurrence, with their start offsets for bisecting.
+    """
+    indicator_spans = []
+    found_indicators = set()
+    for end, indicator in FINANCIAL_INDICATOR_AUTOMATON.iter(text_lower):
+        indicator_spans.append((end + 1 - len(indicator), end + 1))
+        found_indicators.add(indicator)
+        if len(found_indicators) >= 3:  # At least 3 financial terms suggest it's finance-related
+            return True, None, None
+    
+    indicator_spans.sort()
+    return False, indicator_spans, [start for start, _ in indicator_spans]
 
-def is_financially_relevant_context(text, keyword):
+def is_financially_relevant_context(text, keyword, indicator_scan=None, positions=None):
     """
     Check if the keyword appears in a financially relevant context.
     This helps reduce false positives by ensuring the article is actually about finance/business.
+    Pass indicator_scan from scan_financial_indicators(text.lower()) when checking
+    several keywords against the same text, and the keyword's start offsets in the
+    lowercased text as positions when they are already known.
     """
-    # Financial context indicators
-    financial_indicators = [
-        # Market/Trading terms
-        'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
-        'nifty', 'sensex', 'bse', 'nse', 'equity', 'mutual fund', 'ipo', 'listing',
-        
-        # Financial performance
-        'profit', 'loss', 'revenue', 'earnings', 'dividend', 'buyback', 'results',
-        'quarter', 'q1', 'q2', 'q3', 'q4', 'financial year', 'fy', 'annual',
-        
-        # Business operations
-        'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
-        'management', 'board', 'ceo', 'cfo', 'chairman', 'director',
-        
-        # Economic indicators
-        'economy', 'economic', 'gdp', 'inflation', 'rbi', 'sebi', 'rupee',
-        'currency', 'fiscal', 'budget', 'policy', 'rate', 'bank', 'banking',
-        
-        # Investment terms
-        'fund', 'capital', 'debt', 'credit', 'loan', 'finance', 'financial',
-        'valuation', 'price', 'value', 'worth', 'cost', 'expense',
-        
-        # Market sentiment
-        'bullish', 'bearish', 'rally', 'correction', 'volatile', 'trend',
-        'growth', 'decline', 'surge', 'drop', 'gain', 'fall'
-    ]
-    
-    # Check if any financial indicators appear near the keyword (within reasonable distance)
     text_lower = text.lower()
     
-    # Find all positions of the keyword
-    keyword_positions = []
-    start = 0
-    while True:
-        pos = text_lower.find(keyword.lower(), start)
-        if pos == -1:
-            break
-        keyword_positions.append(pos)
-        start = pos + 1
+    # If the text contains multiple financial indicators, it's likely relevant
+    if indicator_scan is None:
+        indicator_scan = scan_financial_indicators(text_lower)
+    is_dense, indicator_spans, indicator_starts = indicator_scan
+    if is_dense:
+        return True
+    if not indicator_spans:
+        return False
     
     # For each keyword occurrence, check surrounding context (100 characters before and after)
+    # for an indicator that lies entirely inside it
     context_window = 100
-    for pos in keyword_positions:
+    if positions is None:
+        positions = find_all(text_lower, keyword.lower())
+    for pos in positions:
         start_context = max(0, pos - context_window)
         end_context = min(len(text_lower), pos + len(keyword) + context_window)
-        context = text_lower[start_context:end_context]
         
-        # Check if any financial indicator is in this context
-        for indicator in financial_indicators:
-            if indicator in context:
+        i = bisect_left(indicator_starts, start_context)
+        while i < len(indicator_spans) and indicator_starts[i] < end_context:
+            if indicator_spans[i][1] <= end_context:
                 return True
-    
-    # Additional check: if the text contains multiple financial indicators, it's likely relevant
-    indicator_count = sum(1 for indicator in financial_indicators if indicator in text_lower)
-    if indicator_count >= 3:  # At least 3 financial terms suggest it's finance-related
-        return True
+            i += 1
     
     return False
 
@@ -106,19 +256,25 @@ def clean_html_content(text):
     if not text:
         return text
     
+    # Plain text (no entities, no tags): only the whitespace needs normalizing
+    if '&' not in text and '<' not in text:
+        return ' '.join(text.split())
+    
     # Decode HTML entities like &amp;nbsp;, &amp;, &quot;, etc.
     cleaned = html.unescape(text)
     
     # Remove HTML tags if any
-    cleaned = re.sub(r'<[^>]+>', '', cleaned)
+    if '<' in cleaned:
+        cleaned = SCRIPT_STYLE_PATTERN.sub('', cleaned)
+        cleaned = HTML_TAG_PATTERN.sub('', cleaned)
     
-    # Remove extra whitespace characters including non-breaking spaces
-    cleaned = re.sub(r'\xa0', ' ', cleaned)  # Non-breaking space
-    cleaned = re.sub(r'\u00a0', ' ', cleaned)  # Unicode non-breaking space
-    cleaned = re.sub(r'&nbsp;', ' ', cleaned)  # Any remaining &nbsp;
-    cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single space
+    # Any remaining &nbsp;
+    if '&nbsp;' in cleaned:
+        cleaned = cleaned.replace('&nbsp;', ' ')
     
-    return cleaned.strip()
+    # Collapse whitespace runs (non-breaking spaces included) to single spaces and trim,
+    # in one C-level split/join instead of regex passes
+    return ' '.join(cleaned.split())
 
 def clean_time_references(text):
     """
@@ -128,33 +284,22 @@ def clean_time_references(text):
     if not text:
         return text
     
-    # More comprehensive patterns to match time references anywhere in text
-    time_patterns = [
-        r'\b\d+\s*(hour|hours|hr|hrs|minute|minutes|min|mins)\s*ago\b',
-        r'\b(today|yesterday|earlier today|this morning|this evening)\b',
-        r'\b\d+\s*days?\s*ago\b',
-        r'\bLive:\s*',
-        r'\bBreaking:\s*',
-        r'\bUpdate:\s*',
-        r'\s*\d+\s*(minute|minutes|min|hour|hours|hr|day|days)\s*ago\s*',
-        r'\s*Yesterday\s*',
-        r'\s*Today\s*',
-        r'\s*\d+\s*(min|hr)\s*',
-        r'\s*\d+\s*(minute|minutes|hour|hours|day|days)\s*',
-        r'By\s+[A-Za-z\s]+$',  # Remove "By Author Name" at the end
-    ]
+    # Most titles hold no time reference or byline at all
+    if not TIME_REFERENCE_MARKERS_PATTERN.search(text):
+        return ' '.join(text.split())
     
+    # More comprehensive patterns to match time references anywhere in text
     cleaned_text = text
-    for pattern in time_patterns:
-        cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+    for pattern in TIME_REFERENCE_PATTERNS:
+        cleaned_text = pattern.sub('', cleaned_text)
     
     # Remove author bylines (patterns like "- Author Name" at the end)
-    cleaned_text = re.sub(r'\s*-\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$', '', cleaned_text)
-    cleaned_text = re.sub(r'\s*\|\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*$', '', cleaned_text)
+    cleaned_text = DASH_BYLINE_PATTERN.sub('', cleaned_text)
+    cleaned_text = PIPE_BYLINE_PATTERN.sub('', cleaned_text)
     
     # Clean up extra whitespace and trailing punctuation
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-    cleaned_text = re.sub(r'\s*[-|]\s*$', '', cleaned_text).strip()  # Remove trailing - or |
+    cleaned_text = WHITESPACE_PATTERN.sub(' ', cleaned_text).strip()
+    cleaned_text = TRAILING_SEPARATOR_PATTERN.sub('', cleaned_text).strip()  # Remove trailing - or |
     
     return cleaned_text
 
@@ -165,10 +310,10 @@ def split_source_title(text):
     """
     if not text:
         return None, text
-    parts = re.split(r'(?i)more', text, maxsplit=1)
-    if len(parts) > 1:
-        source = parts[0].strip()
-        title = parts[1].strip()
+    match = MORE_PATTERN.search(text)
+    if match:
+        source = text[:match.start()].strip()
+        title = text[match.end():].strip()
         return source, title
     else:
         return None, text
@@ -176,42 +321,87 @@ def split_source_title(text):
 def get_today_date():
     return datetime.now().strftime('%Y-%m-%d')
 
-def fetch_stock_news_direct_rss(keywords, max_articles_per_source=20):
+def fetch_rss_entries(source_name, rss_url):
+    """Download and parse one RSS feed, returning its entries ([] if it failed or is empty)"""
+    try:
+        response = RSS_SESSION.get(rss_url, timeout=(RSS_CONNECT_TIMEOUT_SECONDS, RSS_FETCH_TIMEOUT_SECONDS))
+        response.raise_for_status()
+        # Every field used is cleaned with clean_html_content afterwards, so feedparser's own
+        # (pure-Python) HTML sanitizing and link rewriting would be wasted work
+        feed = feedparser.parse(response.content, sanitize_html=False, resolve_relative_uris=False)
+        
+        # Check if feed was parsed successfully
+        if not hasattr(feed, 'entries') or not feed.entries:
+            logging.warning(f"No entries found for {source_name} - {rss_url}")
+            return []
+        return feed.entries
+        
+    except Exception as e:
+        logging.error(f"Error fetching from {source_name} ({rss_url}): {e}")
+        return []
+
+def _as_naive_utc(value):
+    """Aware datetimes converted to UTC and made naive, so every feed's dates compare"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# Articles of a feed snapshot share a handful of timestamps, so parsed dates are cached
+@lru_cache(maxsize=8192)
+def parse_feed_sort_date(date_str):
+    """Publication datetime of an RSS article for sorting (naive UTC); datetime.min if unparseable"""
+    if not date_str or not isinstance(date_str, str):
+        return datetime.min
+    # RSS feeds use RFC 822 dates ("Wed, 22 Mar 2024 10:15:00 +0530"), Atom ones ISO 8601
+    try:
+        return _as_naive_utc(parsedate_to_datetime(date_str))
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return _as_naive_utc(datetime.fromisoformat(date_str.strip()))
+    except ValueError:
+        return datetime.min
+
+@lru_cache(maxsize=4096)
+def parse_published_date(published):
+    """ISO calendar date of an RSS published timestamp; raises if dateutil can't parse it"""
+    return date_parser.parse(published).date().isoformat()
+
+def load_all_rss_articles(max_articles_per_source=20):
     """
-    Fetch stock news from direct RSS feeds that provide actual article URLs
-    This is the PRIMARY method that provides real article URLs
+    Fetch and clean the articles of every direct RSS feed, newest first.
+    The feeds are the same for every stock, so fetch them once per run and filter the
+    result per stock with filter_articles_for_keywords. Each article also carries its
+    lowercased title/summary and whether it mentions a finance keyword, so the
+    per-stock filter doesn't redo that work.
     """
     all_articles = []
     
-    for source_name, rss_url in RSS_SOURCES.items():
-        try:
-            # Add timeout and better error handling
-            import socket
-            socket.setdefaulttimeout(10)  # 10 second timeout
-            
-            feed = feedparser.parse(rss_url)
-            
-            # Check if feed was parsed successfully
-            if not hasattr(feed, 'entries') or not feed.entries:
-                logging.warning(f"No entries found for {source_name} - {rss_url}")
-                continue
-                
-        except Exception as e:
-            logging.error(f"Error fetching from {source_name} ({rss_url}): {e}")
-            continue
-        
+    # The feeds are fetched concurrently; results still come back in RSS_SOURCES order
+    with ThreadPoolExecutor(max_workers=RSS_FETCH_WORKERS) as executor:
+        feed_entries = list(executor.map(fetch_rss_entries, RSS_SOURCES.keys(), RSS_SOURCES.values()))
+    
+    # Add metadata for tracking
+    scraped_at = datetime.now().isoformat()
+    
+    for source_name, entries in zip(RSS_SOURCES, feed_entries):
         try:
-            for entry in feed.entries[:max_articles_per_source]:
-                # Extract article data
+            for entry in entries[:max_articles_per_source]:
+                # Extract article data. The description is only looked up when there's no
+                # summary, and the content list only read once.
+                summary = entry.get('summary')
+                if summary is None:
+                    summary = entry.get('description', '')
+                content = entry.get('content')
                 article = {
                     'title': entry.get('title', '').strip(),
                     'url': entry.get('link', ''),  # ACTUAL ARTICLE URL!
                     'source': source_name,
                     'published': entry.get('published', ''),
-                    'summary': entry.get('summary', entry.get('description', '')),
+                    'summary': summary,
                     'author': entry.get('author', ''),
                     'category': entry.get('category', ''),
-                    'content': entry.get('content', [{}])[0].get('value', '') if entry.get('content') else ''
+                    'content': content[0].get('value', '') if content else ''
                 }
                 
                 # Clean HTML entities and time references from title and content
@@ -225,71 +415,86 @@ def fetch_stock_news_direct_rss(keywords, max_articles_per_source=20):
                 if article['content']:
                     article['content'] = clean_html_content(article['content'])
                 
-                # Filter for stock/finance related content
-                title_lower = article['title'].lower()
-                summary_lower = article['summary'].lower()
-                
-                # Stock/finance keywords to filter relevant articles
-                finance_keywords = [
-                    'stock', 'market', 'share', 'nifty', 'sensex', 'bse', 'nse',
-                    'equity', 'trading', 'investment', 'profit', 'loss', 'earning',
-                    'revenue', 'financial', 'rupee', 'currency', 'economy',
-                    'fund', 'ipo', 'dividend', 'quarter', 'q1', 'q2', 'q3', 'q4',
-                    'fiscal', 'budget', 'inflation', 'gdp', 'rbi', 'sebi',
-                    'mutual fund', 'portfolio', 'bullish', 'bearish', 'buyback'
-                ]
+                if not (article['url'] and article['title']):
+                    continue
                 
-                # Check if article is finance-related or matches keywords
-                is_relevant = False
+                # Lowercased once here for every stock's filter
+                article['_title_lower'] = article['title'].lower()
+                article['_summary_lower'] = article['summary'].lower()
+                # The text every stock's keywords are checked against, and its financial
+                # indicators, shared by all of those checks
+                article['_text_lower'] = f"{article['title']} {article['summary']}".lower()
+                article['_indicator_scan'] = scan_financial_indicators(article['_text_lower'])
                 
-                # Check against finance keywords
-                if any(keyword in title_lower for keyword in finance_keywords) or \
-                   any(keyword in summary_lower for keyword in finance_keywords):
-                    is_relevant = True
+                # NUL-separated so a keyword can't match across title and summary
+                article['_finance_related'] = contains_any(
+                    FINANCE_KEYWORD_AUTOMATON, f"{article['_title_lower']}\0{article['_summary_lower']}"
+                )
                 
-                # Check against user's stock keywords
-                if keywords:
-                    for keyword in keywords:
-                        if keyword.lower() in title_lower or keyword.lower() in summary_lower:
-                            is_relevant = True
-                            break
-                
-                if is_relevant and article['url'] and article['title']:
-                    # Add metadata for tracking
-                    article['scraped_at'] = datetime.now().isoformat()
-                    all_articles.append(article)
+                article['scraped_at'] = scraped_at
+                all_articles.append(article)
                     
         except Exception as e:
             logging.error(f"Error processing entries from {source_name}: {e}")
             continue
     
     # Sort by publication date (newest first)
-    def parse_date(date_str):
-        try:
-            if date_str:
-                # Try different date formats
-                for fmt in ['%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%d %H:%M:%S']:
-                    try:
-                        return datetime.strptime(date_str.split('+')[0].strip(), fmt.replace('%z', ''))
-                    except:
-                        continue
-            return datetime.min
-        except:
-            return datetime.min
-    
-    all_articles.sort(key=lambda x: parse_date(x['published']), reverse=True)
+    all_articles.sort(key=lambda x: parse_feed_sort_date(x['published']), reverse=True)
+    return all_articles
+
+def filter_articles_for_keywords(articles, keywords):
+    """
+    The articles from load_all_rss_articles that are finance-related or mention one of
+    the keywords, without duplicate URLs, keeping their newest-first order.
+    """
+    # The user's stock keywords, matched in one pass per article. An empty keyword
+    # occurs in every text, so it makes every article relevant.
+    keywords_lower = [keyword.lower() for keyword in keywords or []]
+    keyword_automaton = build_keyword_automaton(keywords_lower)
+    matches_every_article = '' in keywords_lower
     
     # Remove duplicates based on URL
     seen_urls = set()
     unique_articles = []
     
-    for article in all_articles:
-        if article['url'] not in seen_urls:
+    for article in articles:
+        # Check if article is finance-related or matches the user's stock keywords
+        is_relevant = (article['_finance_related']
+                       or matches_every_article
+                       or contains_any(keyword_automaton, f"{article['_title_lower']}\0{article['_summary_lower']}"))
+        
+        if is_relevant and article['url'] not in seen_urls:
             seen_urls.add(article['url'])
             unique_articles.append(article)
             
     return unique_articles
 
+def fetch_stock_news_direct_rss(keywords, max_articles_per_source=20):
+    """
+    Fetch stock news from direct RSS feeds that provide actual article URLs
+    This is the PRIMARY method that provides real article URLs
+    """
+    return filter_articles_for_keywords(load_all_rss_articles(max_articles_per_source), keywords)
+
+def _article_title_tag(item):
+    """
+    The tag holding an <article>'s headline, in order of preference: a link inside an
+    <h3>, a link inside an <h4>, an <h3>, an <h4>. Collects the headings in a single
+    walk of the subtree rather than one CSS query per preference.
+    """
+    headings = item.find_all(['h3', 'h4'])
+    for heading_name in ('h3', 'h4'):
+        for heading in headings:
+            if heading.name == heading_name:
+                link = heading.find('a')
+                if link is not None:
+                    return link
+    for heading_name in ('h3', 'h4'):
+        for heading in headings:
+            if heading.name == heading_name:
+                return heading
+    return None
+
 def fetch_stock_news(stock):
     """
     Fallback method using Google News HTML scraping
@@ -301,15 +506,14 @@ def fetch_stock_news(stock):
         print(f"Failed to fetch news for {stock}: {response.status_code}")
         return []
     
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Only the <article> subtrees are used, so only they are built into the tree
+    soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("article"))
     articles = []
+    scraped_at = datetime.now().isoformat()
     
     for item in soup.select("article"):
         # Try multiple selectors for title
-        title_tag = (item.select_one("h3 a") or 
-                    item.select_one("h4 a") or
-                    item.select_one("h3") or
-                    item.select_one("h4"))
+        title_tag = _article_title_tag(item)
         
         link = title_tag.get('href') if title_tag and title_tag.name == 'a' else None
         title = title_tag.get_text(strip=True) if title_tag else None
@@ -320,12 +524,8 @@ def fetch_stock_news(stock):
         # Try to extract title from article text if not found
         if not title and article_text:
             # Look for the main headline in the article text
-            lines = article_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if len(line) > 20 and not line.startswith('http'):  # Likely a title
-                    title = line
-                    break
+            lines = (line.strip() for line in article_text.split('\n'))
+            title = next((line for line in lines if len(line) > 20 and not line.startswith('http')), title)  # Likely a title
         
         # Clean time references from title and article text
         if title:
@@ -337,14 +537,13 @@ def fetch_stock_news(stock):
         
         # Extract source from article text (before "More")
         source_from_text = None
-        if article_text and 'more' in article_text.lower():
-            parts = re.split(r'(?i)more', article_text, maxsplit=1)
-            if len(parts) > 1:
-                potential_source = parts[0].strip()
-                # Clean up source - remove common non-source text
-                potential_source = re.sub(r'^\d+\s*(minute|minutes|hour|hours|day|days)\s*ago\s*', '', potential_source, flags=re.IGNORECASE)
-                if potential_source and len(potential_source) < 50:  # Reasonable source length
-                    source_from_text = potential_source
+        more_match = MORE_PATTERN.search(article_text) if article_text else None
+        if more_match:
+            potential_source = article_text[:more_match.start()].strip()
+            # Clean up source - remove common non-source text
+            potential_source = LEADING_TIME_AGO_PATTERN.sub('', potential_source)
+            if potential_source and len(potential_source) < 50:  # Reasonable source length
+                source_from_text = potential_source
         
         # Split source and title using split_source_title
         source, clean_title = split_source_title(title)
@@ -355,7 +554,7 @@ def fetch_stock_news(stock):
         summary = article_text if article_text != title else None
         _, clean_summary = split_source_title(summary) if summary else (None, None)
         
-        published = item.select_one("time")
+        published = item.find("time")
         published_time = published.get('datetime') if published and published.has_attr('datetime') else None
         
         full_url = None
@@ -374,17 +573,437 @@ def fetch_stock_news(stock):
             "summary": clean_summary,
             "url": full_url,
             "published": published_time,
-            "scraped_at": datetime.now().isoformat()
+            "scraped_at": scraped_at
         })
     
     return articles
 
 
 
+# Keys of the articles already in the news table, kept across runs so that articles
+# seen before skip the check_existing_news round-trip. Each line is "<key>\t<YYYY-MM-DD>"
+SEEN_NEWS_FILE = Path("logs") / "gnews_seen_news.txt"
+# Keys older than this are dropped on load, bounding the file and letting the table
+# be asked again about articles seen long ago
+SEEN_NEWS_MAX_AGE_DAYS = 30
+# Stocks are processed in parallel, so additions to the set and file are serialized
+_seen_news_lock = threading.Lock()
+
+def seen_news_key(yfin_symbol, url):
+    """Compact key for an article stored under a stock, or None without a URL"""
+    if not url:
+        return None
+    return blake2b(f"{yfin_symbol}\0{url}".encode("utf-8"), digest_size=16).hexdigest()
+
+def load_seen_news(path=SEEN_NEWS_FILE, max_age_days=SEEN_NEWS_MAX_AGE_DAYS):
+    """
+    Keys recorded by earlier runs with remember_seen_news within the last max_age_days.
+    Expired (or undated) lines are pruned by rewriting the file without them.
+    """
+    path = Path(path)
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).date().isoformat()
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = [line.split() for line in f]
+    except FileNotFoundError:
+        return set()
+    # ISO dates compare correctly as strings
+    kept = [entry for entry in entries if len(entry) == 2 and entry[1] >= cutoff]
+    if len(kept) < len(entries):
+        pruned_path = path.with_name(path.name + ".tmp")
+        with open(pruned_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{key}\t{day}\n" for key, day in kept)
+        pruned_path.replace(path)
+    return {key for key, _ in kept}
+
+def remember_seen_news(seen_news, keys, path=SEEN_NEWS_FILE):
+    """Record articles known to be in the news table, for this run and later ones,
+    appending all of the new keys to the file in one write"""
+    with _seen_news_lock:
+        new_keys = [key for key in dict.fromkeys(keys) if key is not None and key not in seen_news]
+        if not new_keys:
+            return
+        seen_news.update(new_keys)
+        today = datetime.now(timezone.utc).date().isoformat()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{key}\t{today}\n" for key in new_keys))
+
+def store_pending_news(pending, seen_news):
+    """
+    Insert the pending (news row, seen key) pairs in a single request and remember them
+    as seen if the batch was stored. Returns the number of rows stored.
+    """
+    if not pending:
+        return 0
+    stored = store_news_articles([row for row, _ in pending])
+    if stored == len(pending):
+        remember_seen_news(seen_news, [seen_key for _, seen_key in pending])
+    return stored
+
+def parse_stock_keywords(keyword_lst):
+    """
+    Keywords from a stock's keyword_lst column: {"keyword": [...]} (as JSON text or
+    already decoded) or a bare list. None for any other shape; raises on invalid JSON.
+    """
+    kw_obj = json.loads(keyword_lst) if isinstance(keyword_lst, str) else keyword_lst
+    if isinstance(kw_obj, dict) and 'keyword' in kw_obj:
+        return kw_obj['keyword']
+    elif isinstance(kw_obj, list):
+        return kw_obj
+    return None
+
+def index_rss_keywords(articles, keywords_lower):
+    """
+    Inverted index of the keywords over the RSS articles, from one automaton pass per
+    article. Each article gets '_keyword_positions' (keyword -> start offsets in its
+    '_text_lower'); returns keyword -> the articles containing it.
+    """
+    automaton = build_keyword_automaton(keywords_lower)
+    postings = {}
+    for article in articles:
+        article['_keyword_positions'] = keyword_positions(automaton, article['_text_lower'])
+        for keyword in article['_keyword_positions']:
+            postings.setdefault(keyword, []).append(article)
+    return postings
+
 def save_news(news, filename="article.json"):
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(news, f, ensure_ascii=False, indent=2)
+    # orjson writes UTF-8 bytes directly (non-ASCII titles stay readable, as with ensure_ascii=False)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(news, option=orjson.OPT_INDENT_2))
+
+
 
+def process_stock(stock, rss_articles, rss_keyword_postings, seen_news):
+    """
+    Match, deduplicate and store one stock's news: its articles from the shared RSS
+    articles first, then Google News if RSS found fewer than 5. Returns a dict with
+    the stock's id, found/inserted/skipped counts and matched news, or None when the
+    stock has no keywords. Runs for several stocks at once: the shared articles and
+    index are only read, and seen_news only grows through remember_seen_news.
+    """
+    stock_id = stock['id']
+    yfin_symbol = stock.get('yfin_symbol')
+    keywords = []
+    if stock.get('keyword_lst'):
+        try:
+            parsed_keywords = parse_stock_keywords(stock['keyword_lst'])
+            if parsed_keywords is not None:
+                keywords = parsed_keywords
+                logger.info("keywords list: %s", keywords)
+        except Exception as e:
+            logger.error(f"Error parsing keywords for {stock_id}: {e}")
+    if not keywords:
+        logger.info(f"No keywords found for {stock_id}, skipping.")
+        return None
+    stock_news = []
+    inserted = 0
+    skipped = 0
+    found = 0
+    # Fallback published_date for articles without a usable date
+    today = datetime.now().date().isoformat()
+    logger.info(f"Fetching news for {stock_id} using keywords: {keywords}")
+    
+    # PRIMARY METHOD: Direct RSS feeds (provides actual article URLs)
+    try:
+        logger.info(f"  -> Using DIRECT RSS feeds for {stock_id}")
+        rss_news = filter_articles_for_keywords(rss_articles, keywords)
+        logger.info(f"  -> {len(rss_news)} articles found from RSS feeds")
+        found += len(rss_news)
+        
+        # Each keyword with its lowercased form, computed once for all the articles
+        keyword_pairs = [(kw, kw.lower().strip()) for kw in keywords]
+        
+        # The articles that contain any of this stock's keywords; the rest can't match
+        keyword_articles = {
+            id(article)
+            for _, kw_lower in keyword_pairs
+            for article in rss_keyword_postings.get(kw_lower, ())
+        }
+        
+        # Process RSS articles: first pick this stock's matching articles, then check
+        # them against the news table in one batch before storing
+        candidates = []
+        for article in rss_news:
+            if id(article) not in keyword_articles:
+                logger.debug("❌ No valid keyword matches found for article: %.50s...", article.get('title', ''))
+                continue
+            
+            # Enhanced keyword matching with word boundaries and context awareness
+            article_text = article['_text_lower']
+            indicator_scan = article['_indicator_scan']
+            # Where each keyword occurs in the article, from the index built for the run
+            present_keywords = article['_keyword_positions']
+            keyword_match = False
+            matched_keywords = []
+            
+            for kw, kw_lower in keyword_pairs:
+                # Skip very short keywords (1-2 chars) as they cause too many false positives
+                if len(kw_lower) <= 2:
+                    logger.debug("Skipping very short keyword '%s' (length <= 2)", kw)
+                    continue
+                
+                # Every check below needs the keyword somewhere in the text
+                if kw_lower not in present_keywords:
+                    continue
+                positions = present_keywords[kw_lower]
+                
+                # For short keywords (3-4 chars), use strict word boundary matching
+                if len(kw_lower) <= 4:
+                    # Use word boundaries to avoid partial matches (e.g., "RIL" in "trillion")
+                    if contains_word(article_text, kw_lower, positions):
+                        # Additional context check for financial relevance
+                        if is_financially_relevant_context(article_text, kw_lower, indicator_scan, positions):
+                            keyword_match = True
+                            matched_keywords.append(kw)
+                            logger.debug("✅ Strict match found for short keyword '%s' with financial context", kw)
+                            break
+                        else:
+                            logger.debug("⚠️ Keyword '%s' found but lacks financial context", kw)
+                
+                # For medium keywords (5-8 chars), use word boundary but allow some flexibility
+                elif len(kw_lower) <= 8:
+                    if contains_word(article_text, kw_lower, positions):
+                        keyword_match = True
+                        matched_keywords.append(kw)
+                        logger.debug("✅ Medium keyword match found for '%s'", kw)
+                        break
+                    # Also check for partial matches within compound words (e.g., "Axis" in "AxisBank")
+                    elif kw_lower in article_text:
+                        if is_financially_relevant_context(article_text, kw_lower, indicator_scan, positions):
+                            keyword_match = True
+                            matched_keywords.append(kw)
+                            logger.debug("✅ Partial match found for medium keyword '%s' with financial context", kw)
+                            break
+                
+                # For longer keywords (9+ chars), allow partial matches but verify context
+                else:
+                    if kw_lower in article_text:
+                        if is_financially_relevant_context(article_text, kw_lower, indicator_scan, positions):
+                            keyword_match = True
+                            matched_keywords.append(kw)
+                            logger.debug("✅ Long keyword match found for '%s' with financial context", kw)
+                            break
+                        else:
+                            logger.debug("⚠️ Long keyword '%s' found but lacks financial context", kw)
+            
+            if not keyword_match:
+                logger.debug("❌ No valid keyword matches found for article: %.50s...", article.get('title', ''))
+                continue
+                
+            title = article.get('title')
+            if not title or not str(title).strip():
+                summary = article.get('summary')
+                if summary and str(summary).strip():
+                    title = summary
+                else:
+                    continue
+            
+            # Stored (or found in the table) by an earlier run: no need to ask the database
+            seen_key = seen_news_key(yfin_symbol, article.get('url'))
+            if seen_key in seen_news:
+                skipped += 1
+                continue
+            
+            logger.debug("Processing RSS article: title=%s, url=%s, source=%s", title, article.get('url'), article.get('source'))
+            candidates.append((article, title, matched_keywords, seen_key))
+        
+        try:
+            existing = find_existing_news([(title, yfin_symbol) for _, title, _, _ in candidates])
+        except Exception as e:
+            logger.error(f"Network/API error checking for existing RSS news: {e}")
+            skipped += len(candidates)
+            candidates = []
+        
+        # New rows are inserted together once the stock's articles are prepared
+        pending = []
+        queued_titles = set()
+        existing_keys = []
+        for article, title, matched_keywords, seen_key in candidates:
+            if (title, yfin_symbol) in existing:
+                existing_keys.append(seen_key)
+                skipped += 1
+                continue
+            # The same title can come from two feeds; only the first is stored
+            if title in queued_titles:
+                skipped += 1
+                continue
+            queued_titles.add(title)
+            
+            # Parse published_date
+            published_date_str = None
+            try:
+                if article.get('published'):
+                    # Try to parse RSS date format
+                    published_date_str = parse_published_date(article.get('published'))
+                else:
+                    published_date_str = today
+            except Exception as e:
+                logger.error(f"Error parsing RSS published_date: {e}")
+                published_date_str = today
+            
+            # Extract source name (remove "- Markets" etc. suffixes)
+            source_name = article.get('source', 'RSS Feed')
+            if ' - ' in source_name:
+                source_name = source_name.split(' - ')[0]
+            
+            rss_news_data = {
+                "id": stock_id,
+                "title": title,
+                "content": clean_html_content(article.get('content') or article.get('summary') or ''),
+                "url": article.get('url', ''),  # ACTUAL ARTICLE URL!
+                "source": source_name,
+                "published_at": article.get('published'),
+                "scraped_at": article.get('scraped_at'),
+                "tags": matched_keywords + ["news", "rss"],  # Use only matched keywords
+                "sentiment": None,
+                "sentiment_score": None,
+                "yfin_symbol": yfin_symbol,
+                "published_date": published_date_str
+            }
+            
+            logger.debug("Inserting RSS news_data: %s", rss_news_data)
+            pending.append((rss_news_data, seen_key))
+        
+        remember_seen_news(seen_news, existing_keys)
+        stored = store_pending_news(pending, seen_news)
+        inserted += stored
+        if stored == len(pending):
+            for rss_news_data, _ in pending:
+                logger.info("✅ Successfully stored RSS article: %.50s...", rss_news_data['title'])
+        else:
+            logger.error(f"❌ Error storing {len(pending) - stored} of {len(pending)} RSS news articles for {stock_id}")
+            skipped += len(pending) - stored
+                
+        stock_news.extend(rss_news)
+        
+    except Exception as e:
+        logger.error(f"Error with RSS feeds for {stock_id}: {e}")
+    
+    # FALLBACK METHOD: Google News HTML scraping (if RSS didn't get enough results)
+    if len(stock_news) < 5:  # If we got less than 5 articles from RSS, supplement with Google News
+        logger.info(f"  -> Supplementing with Google News HTML scraping for {stock_id}")
+        # (article, title, tags, seen key) for every keyword, checked and stored together
+        gnews_candidates = []
+        for kw in keywords:
+            # Skip very short keywords for Google News too
+            if len(kw.strip()) <= 2:
+                logger.debug("Skipping very short keyword '%s' for Google News (length <= 2)", kw)
+                continue
+                
+            try:
+                news = fetch_stock_news(kw)
+            except Exception as e:
+                logger.error(f"Error fetching Google News for keyword '{kw}': {e}")
+                continue
+            logger.info(f"  -> {len(news)} articles found for keyword '{kw}' from Google News")
+            found += len(news)
+            
+            # Enhanced filtering for Google News
+            filtered_news = []
+            kw_lower = kw.lower().strip()
+            # Rows are only serialized, so the keyword's articles can share one tags list
+            kw_tags = [kw, "news", "google_news"]
+            for article in news:
+                article_text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+                
+                # Apply same improved matching logic
+                if len(kw_lower) <= 4:
+                    # Strict word boundary matching for short keywords
+                    if contains_word(article_text, kw_lower):
+                        if is_financially_relevant_context(article_text, kw_lower):
+                            filtered_news.append(article)
+                            logger.debug("✅ Google News: Strict match for '%s' with financial context", kw)
+                else:
+                    # More flexible matching for longer keywords
+                    if kw_lower in article_text:
+                        if is_financially_relevant_context(article_text, kw_lower):
+                            filtered_news.append(article)
+                            logger.debug("✅ Google News: Match found for '%s' with financial context", kw)
+            
+            for article in filtered_news:
+                # Use summary as fallback for title if title is missing/empty
+                title = article.get('title')
+                if not title or not str(title).strip():
+                    summary = article.get('summary')
+                    if summary and str(summary).strip():
+                        title = summary
+                    else:
+                        title = None
+                
+                seen_key = seen_news_key(yfin_symbol, article.get('url'))
+                if seen_key in seen_news:
+                    skipped += 1
+                    continue
+                
+                # Skip and log if title is still missing/empty after fallback, before any
+                # lookup or row building is spent on it
+                if title is None:
+                    logger.error("Skipping Google News article with missing/empty title: url=%s, keyword=%s", article.get('url'), kw)
+                    skipped += 1
+                    continue
+                
+                logger.debug("Processing Google News article: title=%s, url=%s", title, article.get('url'))
+                gnews_candidates.append((article, title, kw_tags, seen_key))
+            stock_news.extend(filtered_news)
+        
+        # One existence check for every keyword's articles, then one insert
+        try:
+            existing = find_existing_news([(title, yfin_symbol) for _, title, _, _ in gnews_candidates])
+        except Exception as e:
+            logger.error(f"Network/API error checking for existing Google News: {e}")
+            skipped += len(gnews_candidates)
+            existing, gnews_candidates = set(), []
+        pending = []
+        pending_titles = set()
+        existing_keys = []
+        for article, title, kw_tags, seen_key in gnews_candidates:
+            if (title, yfin_symbol) in existing:
+                existing_keys.append(seen_key)
+                skipped += 1
+                continue
+            # published is the <time datetime> ISO string, so its date is the first 10 chars;
+            # anything else goes through fromisoformat, fallback to today if parsing fails
+            published = article.get('published')
+            if not published:
+                published_date_str = today
+            elif len(published) >= 10 and published[4] == '-' and published[7] == '-':
+                published_date_str = published[:10]
+            else:
+                try:
+                    published_date_str = datetime.fromisoformat(published).date().isoformat()
+                except Exception as e:
+                    logger.error(f"Error parsing Google News published_date: {e}")
+                    published_date_str = today
+            gnews_data = {
+                "id": stock_id,
+                "title": title,
+                "content": None,
+                "url": article.get('url', ''),  # NOTE: These are Google News redirect URLs
+                "source": article.get('source', 'gnews'),
+                "published_at": published,
+                "scraped_at": article.get('scraped_at'),
+                "tags": kw_tags,
+                "sentiment": None,
+                "sentiment_score": None,
+                "yfin_symbol": yfin_symbol,
+                "published_date": published_date_str
+            }
+            # The same headline can turn up for several keywords; only the first is stored
+            if title in pending_titles:
+                skipped += 1
+                continue
+            pending_titles.add(title)
+            logger.debug("Inserting Google News data: %s", gnews_data)
+            pending.append((gnews_data, seen_key))
+        
+        remember_seen_news(seen_news, existing_keys)
+        stored = store_pending_news(pending, seen_news)
+        inserted += stored
+        if stored < len(pending):
+            logger.error(f"Network/API error inserting {len(pending) - stored} of {len(pending)} Google News articles for {stock_id}")
+            skipped += len(pending) - stored
+    logger.info(f"Summary for stock {yfin_symbol}: Found={found}, Inserted={inserted}, Skipped={skipped}")
+    return {"id": stock_id, "found": found, "inserted": inserted, "skipped": skipped, "news": stock_news}
 
 
 def main():
@@ -394,7 +1013,6 @@ def main():
     log_file = log_dir / f"gnews_{datetime.now().strftime('%Y%m%d')}.log"
     error_log_file = log_dir / f"gnews_error_{datetime.now().strftime('%Y%m%d')}.log"
     # Set up logging with UTF-8 encoding for all handlers
-    logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     # File handler for info logs
@@ -425,270 +1043,44 @@ def main():
         news_count_per_stock = {}
         all_news = []
         insert_report = {}
+        seen_news = load_seen_news()
         stocks = fetch_stock_keywords()
         if not stocks:
             logger.info("No active stocks found in database")
             return
+        
+        # The RSS feeds are the same for every stock: fetch them once, filter per stock
+        logger.info("Fetching direct RSS feeds")
+        all_rss_articles = load_all_rss_articles(max_articles_per_source=50)  # Increased to 50 for more comprehensive coverage
+        logger.info(f"{len(all_rss_articles)} articles loaded from RSS feeds")
+        
+        # Index every stock's keywords over the articles once, so each stock only looks
+        # at the articles that mention one of its keywords
+        all_keywords = set()
         for stock in stocks:
-            id = stock['id']
-            yfin_symbol = stock.get('yfin_symbol')
-            keywords = []
-            if stock.get('keyword_lst'):
-                try:
-                    kw_obj = json.loads(stock['keyword_lst']) if isinstance(stock['keyword_lst'], str) else stock['keyword_lst']
-                    if isinstance(kw_obj, dict) and 'keyword' in kw_obj:
-                        keywords = kw_obj['keyword']
-                        logger.info("keywords list: %s", keywords)
-                    elif isinstance(kw_obj, list):
-                        keywords = kw_obj
-                        logger.info("keywords list: %s", keywords)
-                except Exception as e:
-                    logger.error(f"Error parsing keywords for {id}: {e}")
-            if not keywords:
-                logger.info(f"No keywords found for {id}, skipping.")
-                continue
-            stock_news = []
-            inserted = 0
-            skipped = 0
-            found = 0
-            logger.info(f"Fetching news for {id} using keywords: {keywords}")
-            
-            # PRIMARY METHOD: Direct RSS feeds (provides actual article URLs)
             try:
-                logger.info(f"  -> Using DIRECT RSS feeds for {id}")
-                rss_news = fetch_stock_news_direct_rss(keywords, max_articles_per_source=50)  # Increased to 50 for more comprehensive coverage
-                logger.info(f"  -> {len(rss_news)} articles found from RSS feeds")
-                found += len(rss_news)
-                
-                # Process RSS articles
-                for article in rss_news:
-                    # Enhanced keyword matching with word boundaries and context awareness
-                    article_text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-                    keyword_match = False
-                    matched_keywords = []
-                    
-                    for kw in keywords:
-                        kw_lower = kw.lower().strip()
-                        
-                        # Skip very short keywords (1-2 chars) as they cause too many false positives
-                        if len(kw_lower) <= 2:
-                            logger.debug(f"Skipping very short keyword '{kw}' (length <= 2)")
-                            continue
-                        
-                        # For short keywords (3-4 chars), use strict word boundary matching
-                        if len(kw_lower) <= 4:
-                            # Use word boundaries to avoid partial matches (e.g., "RIL" in "trillion")
-                            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-                            if re.search(pattern, article_text):
-                                # Additional context check for financial relevance
-                                if is_financially_relevant_context(article_text, kw_lower):
-                                    keyword_match = True
-                                    matched_keywords.append(kw)
-                                    logger.debug(f"✅ Strict match found for short keyword '{kw}' with financial context")
-                                    break
-                                else:
-                                    logger.debug(f"⚠️ Keyword '{kw}' found but lacks financial context")
-                        
-                        # For medium keywords (5-8 chars), use word boundary but allow some flexibility
-                        elif len(kw_lower) <= 8:
-                            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-                            if re.search(pattern, article_text):
-                                keyword_match = True
-                                matched_keywords.append(kw)
-                                logger.debug(f"✅ Medium keyword match found for '{kw}'")
-                                break
-                            # Also check for partial matches within compound words (e.g., "Axis" in "AxisBank")
-                            elif kw_lower in article_text:
-                                if is_financially_relevant_context(article_text, kw_lower):
-                                    keyword_match = True
-                                    matched_keywords.append(kw)
-                                    logger.debug(f"✅ Partial match found for medium keyword '{kw}' with financial context")
-                                    break
-                        
-                        # For longer keywords (9+ chars), allow partial matches but verify context
-                        else:
-                            if kw_lower in article_text:
-                                if is_financially_relevant_context(article_text, kw_lower):
-                                    keyword_match = True
-                                    matched_keywords.append(kw)
-                                    logger.debug(f"✅ Long keyword match found for '{kw}' with financial context")
-                                    break
-                                else:
-                                    logger.debug(f"⚠️ Long keyword '{kw}' found but lacks financial context")
-                    
-                    if not keyword_match:
-                        logger.debug(f"❌ No valid keyword matches found for article: {article.get('title', '')[:50]}...")
-                        continue
-                        
-                    title = article.get('title')
-                    if not title or not str(title).strip():
-                        summary = article.get('summary')
-                        if summary and str(summary).strip():
-                            title = summary
-                        else:
-                            continue
-                    
-                    logger.info(f"Processing RSS article: title={title}, url={article.get('url')}, source={article.get('source')}")
-                    
-                    try:
-                        if check_existing_news(title, article.get('published'), yfin_symbol):
-                            skipped += 1
-                            continue
-                    except Exception as e:
-                        logger.error(f"Network/API error checking for existing RSS news: {e}")
-                        skipped += 1
-                        continue
-                    
-                    # Parse published_date
-                    published_date_str = None
-                    try:
-                        if article.get('published'):
-                            # Try to parse RSS date format
-                            from dateutil import parser
-                            parsed_date = parser.parse(article.get('published'))
-                            published_date_str = parsed_date.date().isoformat()
-                        else:
-                            published_date_str = datetime.now().date().isoformat()
-                    except Exception as e:
-                        logger.error(f"Error parsing RSS published_date: {e}")
-                        published_date_str = datetime.now().date().isoformat()
-                    
-                    # Extract source name (remove "- Markets" etc. suffixes)
-                    source_name = article.get('source', 'RSS Feed')
-                    if ' - ' in source_name:
-                        source_name = source_name.split(' - ')[0]
-                    
-                    rss_news_data = {
-                        "id": id,
-                        "title": title,
-                        "content": clean_html_content(article.get('content') or article.get('summary') or ''),
-                        "url": article.get('url', ''),  # ACTUAL ARTICLE URL!
-                        "source": source_name,
-                        "published_at": article.get('published'),
-                        "scraped_at": article.get('scraped_at'),
-                        "tags": matched_keywords + ["news", "rss"],  # Use only matched keywords
-                        "sentiment": None,
-                        "sentiment_score": None,
-                        "yfin_symbol": yfin_symbol,
-                        "published_date": published_date_str
-                    }
-                    
-                    logger.debug(f"Inserting RSS news_data: {rss_news_data}")
-                    try:
-                        store_news_article(rss_news_data)
-                        inserted += 1
-                        logger.info(f"✅ Successfully stored RSS article: {title[:50]}...")
-                    except Exception as e:
-                        logger.error(f"❌ Error storing RSS news article: {e}")
-                        logger.error(f"Failed article data: {rss_news_data}")
-                        skipped += 1
-                        
-                stock_news.extend(rss_news)
-                
-            except Exception as e:
-                logger.error(f"Error with RSS feeds for {id}: {e}")
-            
-            # FALLBACK METHOD: Google News HTML scraping (if RSS didn't get enough results)
-            if len(stock_news) < 5:  # If we got less than 5 articles from RSS, supplement with Google News
-                logger.info(f"  -> Supplementing with Google News HTML scraping for {id}")
-                for kw in keywords:
-                    # Skip very short keywords for Google News too
-                    if len(kw.strip()) <= 2:
-                        logger.debug(f"Skipping very short keyword '{kw}' for Google News (length <= 2)")
-                        continue
-                        
-                    try:
-                        news = fetch_stock_news(kw)
-                    except Exception as e:
-                        logger.error(f"Error fetching Google News for keyword '{kw}': {e}")
-                        continue
-                    logger.info(f"  -> {len(news)} articles found for keyword '{kw}' from Google News")
-                    found += len(news)
-                    
-                    # Enhanced filtering for Google News
-                    filtered_news = []
-                    for article in news:
-                        article_text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-                        kw_lower = kw.lower().strip()
-                        
-                        # Apply same improved matching logic
-                        if len(kw_lower) <= 4:
-                            # Strict word boundary matching for short keywords
-                            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-                            if re.search(pattern, article_text):
-                                if is_financially_relevant_context(article_text, kw_lower):
-                                    filtered_news.append(article)
-                                    logger.debug(f"✅ Google News: Strict match for '{kw}' with financial context")
-                        else:
-                            # More flexible matching for longer keywords
-                            if kw_lower in article_text:
-                                if is_financially_relevant_context(article_text, kw_lower):
-                                    filtered_news.append(article)
-                                    logger.debug(f"✅ Google News: Match found for '{kw}' with financial context")
-                    
-                    for article in filtered_news:
-                        # Use summary as fallback for title if title is missing/empty
-                        title = article.get('title')
-                        if not title or not str(title).strip():
-                            summary = article.get('summary')
-                            if summary and str(summary).strip():
-                                title = summary
-                            else:
-                                title = None
-                        
-                        logger.info(f"Processing Google News article: title={title}, url={article.get('url')}")
-                        try:
-                            if check_existing_news(title, article.get('published'), yfin_symbol):
-                                skipped += 1
-                                continue
-                        except Exception as e:
-                            logger.error(f"Network/API error checking for existing Google News: {e}")
-                            skipped += 1
-                            continue
-                        # Parse published_date as ISO string, fallback to today if parsing fails
-                        published_date_str = None
-                        try:
-                            if article.get('published'):
-                                published_date_str = datetime.fromisoformat(article.get('published')).date().isoformat()
-                            else:
-                                published_date_str = datetime.now().date().isoformat()
-                        except Exception as e:
-                            logger.error(f"Error parsing Google News published_date: {e}")
-                            published_date_str = datetime.now().date().isoformat()
-                        gnews_data = {
-                            "id": id,
-                            "title": title,
-                            "content": None,
-                            "url": article.get('url', ''),  # NOTE: These are Google News redirect URLs
-                            "source": article.get('source', 'gnews'),
-                            "published_at": article.get('published'),
-                            "scraped_at": article.get('scraped_at'),
-                            "tags": [kw, "news", "google_news"],
-                            "sentiment": None,
-                            "sentiment_score": None,
-                            "yfin_symbol": yfin_symbol,
-                            "published_date": published_date_str
-                        }
-                        # Skip and log if title is still missing/empty after fallback
-                        if not gnews_data['title'] or not str(gnews_data['title']).strip():
-                            logger.error(f"Skipping Google News article with missing/empty title. Data: {gnews_data}")
-                            skipped += 1
-                            continue
-                        logger.debug(f"Inserting Google News data: {gnews_data}")
-                        try:
-                            store_news_article(gnews_data)
-                            inserted += 1
-                        except Exception as e:
-                            logger.error(f"Network/API error inserting Google News: {e}. Data: {gnews_data}")
-                            skipped += 1
-                    stock_news.extend(filtered_news)
-            logger.info(f"Summary for stock {yfin_symbol}: Found={found}, Inserted={inserted}, Skipped={skipped}")
-            total_found += found
-            total_inserted += inserted
-            total_skipped += skipped
-            news_count_per_stock[id] = len(stock_news)
-            all_news.extend(stock_news)
-            insert_report[id] = {"inserted": inserted, "skipped": skipped}
+                all_keywords.update(kw.lower().strip() for kw in parse_stock_keywords(stock.get('keyword_lst')) or [])
+            except Exception:
+                pass  # Reported when the stock itself is processed
+        rss_keyword_postings = index_rss_keywords(all_rss_articles, all_keywords)
+        
+        # Stocks are independent, so several are matched and stored at once; the
+        # results still come back (and are reported) in stock order
+        with ThreadPoolExecutor(max_workers=STOCK_WORKERS) as executor:
+            results = list(executor.map(
+                lambda stock: process_stock(stock, all_rss_articles, rss_keyword_postings, seen_news),
+                stocks,
+            ))
+        for result in results:
+            if result is None:
+                continue
+            stock_id = result["id"]
+            total_found += result["found"]
+            total_inserted += result["inserted"]
+            total_skipped += result["skipped"]
+            news_count_per_stock[stock_id] = len(result["news"])
+            all_news.extend(result["news"])
+            insert_report[stock_id] = {"inserted": result["inserted"], "skipped": result["skipped"]}
         logger.info(f"\nTOTAL: Found={total_found}, Inserted={total_inserted}, Skipped={total_skipped}")
         logger.info("\nSummary: News articles per stock:")
         for stock_id, count in news_count_per_stock.items():
@@ -1,4 +1,5 @@
-# This script uses Selenium to scrape news headlines from Moneycontrol for a given company.
+# This script scrapes news headlines from Moneycontrol for a given company, using Selenium
+# only when the plain HTML page doesn't have them.
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -7,11 +8,20 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
 import sys
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent / 'utilities'))
-from store_news_article import store_news_article
-from get_active_stocks import get_active_stocks
+sys.path.append(str(Path(__file__).parent))
+from utilities.store_news_article import store_news_articles
+from utilities.check_existing_news import find_existing_news
+from utilities.get_active_stocks import get_active_stocks
 from datetime import datetime, UTC
 import time
 import logging
@@ -20,59 +30,147 @@ from pathlib import Path
 
 # MoneyControl base URL
 BASE_URL = "https://www.moneycontrol.com/company-article"
+# News pages fetched concurrently ahead of the stock currently being stored
+MC_FETCH_WORKERS = 4
+MC_FETCH_TIMEOUT_SECONDS = 15
+# Minimum time between the starts of two news page requests, shared by all fetch workers
+MC_FETCH_MIN_INTERVAL_SECONDS = 0.5
+# Spaces and dots are dropped from mc_link_2 to get the company part of the news URL
+MC_COMPANY_NAME_STRIP = str.maketrans('', '', ' .')
+# Article timestamps as shown on the news page
+MC_TIMESTAMP_FORMAT = "%I.%M %p | %d %b %Y"
+# Minimum time between two Selenium page loads; time spent storing counts towards it
+MC_BROWSER_MIN_INTERVAL_SECONDS = 2.0
+
+def _build_mc_session():
+    """HTTP session for the news pages: one kept-alive connection pool for every
+    company and two retries on transient failures"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=MC_FETCH_WORKERS,
+                          max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+    session.mount('https://', adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    return session
+
+MC_SESSION = _build_mc_session()
+
+_mc_fetch_lock = threading.Lock()
+_mc_next_fetch_at = 0.0
+
+def _wait_for_fetch_slot():
+    """Block until this worker may start a news page request. Slots are handed out
+    MC_FETCH_MIN_INTERVAL_SECONDS apart across every worker, so the concurrent
+    fetches never hit Moneycontrol faster than one request per interval."""
+    global _mc_next_fetch_at
+    with _mc_fetch_lock:
+        now = time.monotonic()
+        start_at = max(now, _mc_next_fetch_at)
+        _mc_next_fetch_at = start_at + MC_FETCH_MIN_INTERVAL_SECONDS
+    if start_at > now:
+        time.sleep(start_at - now)
 
 # Updated function to scrape specific news headlines, timestamps, and descriptions
 # Function to store news in Supabase
 
-def scrape_moneycontrol_news_selenium(company_name: str, symbol: str):
+def _tag_text(tag):
+    """Tag text with every whitespace run, including ones inside a text node, collapsed to one space"""
+    return ' '.join(tag.get_text(" ", strip=True).split())
+
+def scrape_moneycontrol_news(company_name: str, symbol: str):
+    """
+    Headlines from the server-rendered news page, fetched without a browser.
+    Returns None when the page can't be fetched or has no article blocks (e.g. it
+    was served a challenge page), so the caller can fall back to Selenium.
+    """
     url = f"{BASE_URL}/{company_name}/news/{symbol}"
+    try:
+        _wait_for_fetch_slot()
+        response = MC_SESSION.get(url, timeout=MC_FETCH_TIMEOUT_SECONDS)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Failed to fetch news page for {symbol}: {e}")
+        return None
+
+    soup = BeautifulSoup(response.text, "lxml")
+    articles = soup.select(".MT15.PT10.PB10")
+    if not articles:
+        return None
+
+    headlines = []
+    for article in articles:
+        title_tag = article.select_one("a.g_14bl strong")
+        if title_tag is None:
+            continue
+        # Last link in the block, made absolute the way the browser reports href
+        links = article.find_all("a", href=True)
+        article_url = urljoin(url, links[-1]["href"]) if links else None
+        p_tags = article.find_all("p")
+        headlines.append({
+            "title": _tag_text(title_tag),
+            "timestamp": _tag_text(p_tags[0]) if len(p_tags) > 0 else "",
+            "description": _tag_text(p_tags[1]) if len(p_tags) > 1 else "",
+            "url": article_url
+        })
+    return headlines
+
+# Resources the Selenium fallback never needs. Stylesheets still load: innerText
+# depends on them (hidden elements are left out of it).
+BLOCKED_RESOURCE_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*/ads/*", "*doubleclick*", "*googlesyndication*", "*analytics*",
+]
 
-    # Set up Selenium WebDriver
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    """Installed chromedriver path, looked up by webdriver-manager once per run"""
+    return ChromeDriverManager().install()
+
+def create_chrome_driver():
+    """Chrome WebDriver for scrape_moneycontrol_news_selenium; one is shared by every company"""
     chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    driver = webdriver.Chrome(service=Service(_chromedriver_path()), options=chrome_options)
+    # Only the DOM is read, so skip downloading media, fonts and trackers
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+    return driver
+
+# Same fields as scrape_moneycontrol_news, read from the rendered page by the browser
+EXTRACT_HEADLINES_JS = """
+return Array.from(document.querySelectorAll('.MT15.PT10.PB10')).map(article => {
+    const title = article.querySelector('a.g_14bl strong');
+    if (!title) return null;
+    const paragraphs = article.querySelectorAll('p');
+    const links = article.querySelectorAll('a[href]');
+    return {
+        title: title.innerText.trim(),
+        timestamp: paragraphs.length > 0 ? paragraphs[0].innerText.trim() : '',
+        description: paragraphs.length > 1 ? paragraphs[1].innerText.trim() : '',
+        url: links.length ? links[links.length - 1].href : null
+    };
+}).filter(headline => headline !== null);
+"""
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+def scrape_moneycontrol_news_selenium(driver, company_name: str, symbol: str):
+    url = f"{BASE_URL}/{company_name}/news/{symbol}"
 
     try:
         driver.get(url)
         WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".MT15.PT10.PB10")))
 
-        headlines = []
-        articles = driver.find_elements(By.CSS_SELECTOR, ".MT15.PT10.PB10")
-        for article in articles:
-            article_url = None
-            for elem in article.find_elements(By.XPATH, './/*'):
-                if elem.tag_name == "a":
-                    href = elem.get_attribute("href")
-                    if href:
-                        article_url = href
-            try:
-                title = article.find_element(By.CSS_SELECTOR, "a.g_14bl strong").text.strip()
-                # Get all <p> tags in the article
-                p_tags = article.find_elements(By.TAG_NAME, "p")
-                timestamp = p_tags[0].text.strip() if len(p_tags) > 0 else ""
-                # Use the second <p> tag as the content/summary if available
-                content = p_tags[1].text.strip() if len(p_tags) > 1 else ""
-                headlines.append({
-                    "title": title,
-                    "timestamp": timestamp,
-                    "description": content,
-                    "url": article_url
-                })
-            except Exception:
-                continue
-
-        return headlines
+        # Every headline's fields are collected inside the page in one driver call;
+        # blocks without a headline link are left out
+        return driver.execute_script(EXTRACT_HEADLINES_JS)
 
     except Exception as e:
         print(f"Failed to fetch news for {symbol}: {e}")
         return []
 
-    finally:
-        driver.quit()
-
 
 # Example usage
 if __name__ == "__main__":
@@ -102,66 +200,97 @@ if __name__ == "__main__":
         logger.info("No active stocks found in database")
         exit(1)
     logger.info(f"Found {len(stocks)} active stocks to process")
-    for stock in stocks:
-        id = stock['id']
-        mc_link_1 = stock['mc_link_1']
-        yfin_symbol = stock['yfin_symbol']
-        mc_link_2 = stock['mc_link_2'].lower().replace(' ', '').replace('.', '')
-        logger.info(f"\nProcessing {mc_link_1} ({mc_link_2})...")
-        headlines = scrape_moneycontrol_news_selenium(mc_link_2, mc_link_1)
-        # Print all found headlines for debugging
-        logger.info(f"All headlines for {mc_link_1}:")
-        for h in headlines:
-            logger.info(f"  Title: {h['title']} | Timestamp: {h['timestamp']}")
-        if headlines:
-            logger.info(f"Found {len(headlines)} news articles")
-            stored_count = 0
-            skipped_count = 0
-            for news in headlines:
-                timestamp_str = news['timestamp']
-                full_datetime = None
+    company_names = [stock['mc_link_2'].lower().translate(MC_COMPANY_NAME_STRIP) for stock in stocks]
+    executor = ThreadPoolExecutor(max_workers=MC_FETCH_WORKERS)
+    # Pages are fetched in the background, in stock order, while earlier stocks are stored
+    page_headlines = executor.map(scrape_moneycontrol_news, company_names, [stock['mc_link_1'] for stock in stocks])
+    # Started on the first Selenium fallback and reused for the rest of the run
+    driver = None
+    last_browser_load = None
+    try:
+        for stock, mc_link_2, headlines in zip(stocks, company_names, page_headlines):
+            id = stock['id']
+            mc_link_1 = stock['mc_link_1']
+            yfin_symbol = stock['yfin_symbol']
+            logger.info(f"\nProcessing {mc_link_1} ({mc_link_2})...")
+            if headlines is None:
+                logger.info(f"No articles in the fetched page for {mc_link_1}, falling back to Selenium")
+                if driver is None:
+                    driver = create_chrome_driver()
+                # Only wait for whatever is left of the interval since the last page load
+                if last_browser_load is not None:
+                    wait = MC_BROWSER_MIN_INTERVAL_SECONDS - (time.monotonic() - last_browser_load)
+                    if wait > 0:
+                        time.sleep(wait)
+                last_browser_load = time.monotonic()
+                headlines = scrape_moneycontrol_news_selenium(driver, mc_link_2, mc_link_1)
+            # Print all found headlines for debugging
+            logger.info(f"All headlines for {mc_link_1}:")
+            for h in headlines:
+                logger.info(f"  Title: {h['title']} | Timestamp: {h['timestamp']}")
+            if headlines:
+                logger.info(f"Found {len(headlines)} news articles")
+                stored_count = 0
+                skipped_count = 0
+                # Rows are checked for duplicates and inserted together after the loop
+                pending = []
+                # One clock reading per stock for scraped_at and the published fallbacks
+                scraped_at = datetime.now(UTC).isoformat()
+                today = scraped_at[:10]
+                # Shared by the stock's rows, which are only serialized
+                mc_tags = [stock['mc_link_2'], "news"]
+                for news in headlines:
+                    timestamp_str = news['timestamp']
+                    full_datetime = None
+                    try:
+                        # e.g. "10.30 pm | 09 Oct 2025"; %I/%p take care of 12 am and 12 pm
+                        published_dt = datetime.strptime(timestamp_str, MC_TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+                        full_datetime = published_dt.isoformat()
+                        published_date = published_dt.date().isoformat()
+                    except Exception as e:
+                        logger.error(f"Error parsing timestamp for article '{news['title']}' with raw timestamp '{timestamp_str}': {e}")
+                        # Fallback: use current time as published_at
+                        full_datetime = scraped_at
+                        published_date = today
+                    try:
+                        news_data = {
+                            "id": id,
+                            "title": news['title'],
+                            "content": news['description'],
+                            "url": news['url'],
+                            "source": "moneycontrol",
+                            "yfin_symbol": yfin_symbol,
+                            "published_at": full_datetime,
+                            "scraped_at": scraped_at,
+                            "tags": mc_tags,
+                            "sentiment": None,
+                            "published_date": published_date
+                        }
+                        logger.debug(news_data)
+                        pending.append(news_data)
+                    except Exception as e:
+                        logger.error(f"Error inserting article '{news['title']}': {e}")
+            
+                # One duplicate check and one insert for all of the stock's headlines
                 try:
-                    time_part, date_part = timestamp_str.split(' | ')
-                    time_12h = time_part.lower()
-                    if 'pm' in time_12h and not time_12h.startswith('12'):
-                        hour = int(time_12h.split('.')[0]) + 12
-                        minute = int(time_12h.split('.')[1].split()[0])
-                        time_24h = f"{hour:02d}:{minute:02d}"
-                    elif 'am' in time_12h and time_12h.startswith('12'):
-                        minute = int(time_12h.split('.')[1].split()[0])
-                        time_24h = f"00:{minute:02d}"
-                    else:
-                        hour = int(time_12h.split('.')[0])
-                        minute = int(time_12h.split('.')[1].split()[0])
-                        time_24h = f"{hour:02d}:{minute:02d}"
-                    date_obj = datetime.strptime(date_part, "%d %b %Y")
-                    full_datetime = f"{date_obj.strftime('%Y-%m-%d')}T{time_24h}:00+00:00"
+                    existing = find_existing_news([(news_data['title'], yfin_symbol) for news_data in pending])
                 except Exception as e:
-                    logger.error(f"Error parsing timestamp for article '{news['title']}' with raw timestamp '{timestamp_str}': {e}")
-                    # Fallback: use current time as published_at
-                    full_datetime = datetime.now(UTC).isoformat()
-                try:
-                    news_data = {
-                        "id": id,
-                        "title": news['title'],
-                        "content": news['description'],
-                        "url": news['url'],
-                        "source": "moneycontrol",
-                        "yfin_symbol": yfin_symbol,
-                        "published_at": full_datetime,
-                        "scraped_at": datetime.now(UTC).isoformat(),
-                        "tags": [stock['mc_link_2'], "news"],
-                        "sentiment": None,
-                        "published_date": (datetime.fromisoformat(full_datetime).date().isoformat() if 'T' in full_datetime else datetime.now(UTC).date().isoformat())
-                    }
-                    logger.debug(news_data)
-                    if store_news_article(news_data):
-                        stored_count += 1
-                    else:
+                    logger.error(f"Error checking for existing news, skipping {len(pending)} articles for {yfin_symbol}: {e}")
+                    continue
+                to_store = []
+                queued_titles = set()
+                for news_data in pending:
+                    if (news_data['title'], yfin_symbol) in existing or news_data['title'] in queued_titles:
                         skipped_count += 1
-                except Exception as e:
-                    logger.error(f"Error inserting article '{news['title']}': {e}")
-            logger.info(f"Stored {stored_count} new articles, skipped {skipped_count} existing articles")
-        else:
-            logger.info(f"No news found for {mc_link_1}.")
-        time.sleep(5)
\ No newline at end of file
+                        continue
+                    queued_titles.add(news_data['title'])
+                    to_store.append(news_data)
+                stored_count = store_news_articles(to_store)
+                skipped_count += len(to_store) - stored_count
+                logger.info(f"Stored {stored_count} new articles, skipped {skipped_count} existing articles")
+            else:
+                logger.info(f"No news found for {mc_link_1}.")
+    finally:
+        executor.shutdown()
+        if driver is not None:
+            driver.quit()
\ No newline at end of file
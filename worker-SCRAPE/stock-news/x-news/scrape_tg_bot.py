@@ -60,6 +60,9 @@ import asyncio
 import re
 import json
 import uuid
+import ahocorasick
+from bisect import bisect_left
+from functools import lru_cache
 from supabase import create_client, Client
 
 
@@ -82,6 +85,112 @@ output_csv = 'tg_financial_news.csv'
 limit = 200
 
 
+# Terms whose presence marks a message as finance-related (has_financial_context)
+FINANCIAL_TERMS = frozenset((
+    # Financial terms
+    'earnings', 'revenue', 'profit', 'stock', 'share', 'market', 'trading', 'investment',
+    'portfolio', 'dividend', 'quarterly', 'annual', 'financial', 'business', 'company',
+    'corporate', 'sector', 'industry', 'ipo', 'merger', 'acquisition',
+    
+    # Indian financial terms
+    'nse', 'bse', 'sensex', 'nifty', 'rupee', 'crore', 'lakh',
+    
+    # Performance indicators
+    'growth', 'decline', 'increase', 'decrease', 'rally', 'fall', 'rise',
+    'bullish', 'bearish', 'target', 'support', 'resistance',
+    
+    # Financial symbols
+    '₹', '%', 'q1', 'q2', 'q3', 'q4', 'fy', 'yoy', 'qoq'
+))
+
+# COMPREHENSIVE Financial context indicators (45+ terms covering all financial aspects),
+# used by is_financially_relevant_context
+FINANCIAL_INDICATORS = frozenset((
+    # Core Market/Trading terms
+    'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
+    'equity', 'securities', 'commodity', 'futures', 'options', 'derivatives',
+    
+    # Indian Market Specific
+    'nifty', 'sensex', 'bse', 'nse', 'sebi', 'rbi', 'rupee', 'inr',
+    
+    # Investment Instruments
+    'mutual fund', 'etf', 'ipo', 'fpo', 'listing', 'delisting', 'bond', 'debenture',
+    
+    # Financial Performance Metrics
+    'profit', 'loss', 'revenue', 'earnings', 'ebitda', 'margin', 'turnover',
+    'dividend', 'buyback', 'split', 'bonus', 'rights issue',
+    
+    # Reporting Periods
+    'quarter', 'quarterly', 'q1', 'q2', 'q3', 'q4', 'half year', 'annual',
+    'financial year', 'fy', 'fy24', 'fy25', 'year-on-year', 'yoy', 'qoq',
+    
+    # Business & Corporate
+    'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
+    'corporation', 'limited', 'ltd', 'pvt', 'public', 'private',
+    
+    # Leadership & Governance
+    'management', 'board', 'ceo', 'cfo', 'md', 'chairman', 'director',
+    'shareholder', 'stakeholder', 'promoter', 'institutional',
+    
+    # Economic Environment
+    'economy', 'economic', 'gdp', 'inflation', 'deflation', 'recession',
+    'growth', 'expansion', 'contraction', 'fiscal', 'monetary',
+    
+    # Banking & Finance
+    'bank', 'banking', 'finance', 'financial', 'credit', 'loan', 'deposit',
+    'nbfc', 'fintech', 'insurance', 'fund', 'capital', 'debt',
+    
+    # Policy & Regulation
+    'policy', 'regulation', 'compliance', 'audit', 'governance',
+    'budget', 'tax', 'gst', 'income tax', 'corporate tax',
+    
+    # Valuation & Pricing
+    'valuation', 'price', 'value', 'worth', 'cost', 'expense', 'cap',
+    'market cap', 'enterprise value', 'book value', 'fair value',
+    
+    # Market Sentiment & Movement
+    'bullish', 'bearish', 'rally', 'correction', 'crash', 'bubble',
+    'volatile', 'volatility', 'trend', 'momentum', 'sentiment',
+    'surge', 'plunge', 'spike', 'drop', 'gain', 'fall', 'rise',
+    
+    # Indian Currency Amounts
+    'crore', 'lakh', 'thousand', 'million', 'billion', 'trillion',
+    'rs', 'rupees', '₹', '$', 'usd', 'dollar',
+    
+    # Financial Symbols & Percentages
+    '%', 'percent', 'percentage', 'basis points', 'bps',
+    
+    # Business Operations
+    'merger', 'acquisition', 'takeover', 'divestiture', 'spinoff',
+    'restructuring', 'bankruptcy', 'liquidation', 'ipo', 'opo',
+    
+    # Results & Performance
+    'results', 'performance', 'outlook', 'guidance', 'forecast',
+    'estimate', 'consensus', 'target', 'recommendation', 'rating'
+))
+
+# Common financial patterns like "Rs 1000 crore", "15% growth", etc. (is_financially_relevant_context)
+FINANCIAL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'rs\.?\s*\d+', r'₹\s*\d+', r'\d+\s*crore', r'\d+\s*lakh',
+    r'\d+\s*%', r'\d+\s*percent', r'q[1-4]\s*results', r'fy\d{2}',
+    r'market\s*cap', r'share\s*price', r'stock\s*price',
+    r'earning\s*call', r'annual\s*report', r'financial\s*results'
+))
+
+# URLs removed from titles and message text, and URLs found in message text
+URL_PATTERN = re.compile(r'https?://\S+')
+URL_EXTRACT_PATTERN = re.compile(r'(https?://[^\s\n\]]+)')
+# Emoji trailing a title
+TRAILING_EMOJI_PATTERN = re.compile(r'\s*[👇⤵️📊🚨⏬]+\s*$')
+
+# Enhanced stopwords list to filter out common noise words
+KEYWORD_STOPWORDS = frozenset((
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'up', 'it', 'is', 'as', 'be', 'an', 'a',
+    'this', 'that', 'will', 'are', 'was', 'has', 'have', 'had', 'can', 'may', 'new', 'all', 'any', 'our', 'out', 'day',
+    'get', 'go', 'see', 'come', 'take', 'make', 'know', 'think', 'say', 'use', 'work', 'first', 'last', 'good', 'great'
+))
+
+
 def clean_title(title):
     """Enhanced title cleaning function"""
     if not title:
@@ -93,13 +202,13 @@ def clean_title(title):
             title = title.split(delimiter)[0].strip()
     
     # Remove URLs from title
-    title = re.sub(r'https?://\S+', '', title).strip()
+    title = URL_PATTERN.sub('', title).strip()
     
     # Clean up extra whitespace and newlines
     title = ' '.join(title.split())
     
     # Remove emoji patterns at the end
-    title = re.sub(r'\s*[👇⤵️📊🚨⏬]+\s*$', '', title)
+    title = TRAILING_EMOJI_PATTERN.sub('', title)
     
     return title
 
@@ -127,7 +236,7 @@ def extract_best_url(message):
     
     # Method 4: Regex search in text
     if message.text:
-        regex_urls = re.findall(r'(https?://[^\s\n\]]+)', message.text)
+        regex_urls = URL_EXTRACT_PATTERN.findall(message.text)
         for url in regex_urls:
             # Clean up the URL
             url = url.rstrip('.,;:)')
@@ -175,7 +284,7 @@ def extract_content(message):
     # Method 3: Message text (fallback)
     if message.text:
         # Clean text by removing URLs and cleaning whitespace
-        clean_text = re.sub(r'https?://\S+', '', message.text)
+        clean_text = URL_PATTERN.sub('', message.text)
         clean_text = ' '.join(clean_text.split())
         if clean_text:
             content_sources.append(('message_text', clean_text))
@@ -195,27 +304,91 @@ def has_financial_context(text):
     if not text:
         return False
     
-    financial_indicators = [
-        # Financial terms
-        'earnings', 'revenue', 'profit', 'stock', 'share', 'market', 'trading', 'investment',
-        'portfolio', 'dividend', 'quarterly', 'annual', 'financial', 'business', 'company',
-        'corporate', 'sector', 'industry', 'ipo', 'merger', 'acquisition',
-        
-        # Indian financial terms
-        'nse', 'bse', 'sensex', 'nifty', 'rupee', 'crore', 'lakh',
-        
-        # Performance indicators
-        'growth', 'decline', 'increase', 'decrease', 'rally', 'fall', 'rise',
-        'bullish', 'bearish', 'target', 'support', 'resistance',
-        
-        # Financial symbols
-        '₹', '%', 'q1', 'q2', 'q3', 'q4', 'fy', 'yoy', 'qoq'
-    ]
-    
     text_lower = text.lower()
-    return any(indicator in text_lower for indicator in financial_indicators)
+    return any(indicator in text_lower for indicator in FINANCIAL_TERMS)
+
+def _is_word_char(char):
+    """Same definition of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+def find_all(text, word):
+    """Start offset of every occurrence of word in text, overlapping ones included"""
+    pos = text.find(word)
+    while pos != -1:
+        yield pos
+        pos = text.find(word, pos + 1)
 
-def is_financially_relevant_context(text, keyword):
+@lru_cache(maxsize=256)
+def keyword_automaton(keywords_lower):
+    """
+    Aho-Corasick automaton over a tuple of lowercased keywords, built once per keyword
+    list (every message of a scrape is matched against the same list). None if there
+    are no non-empty keywords.
+    """
+    keywords_lower = {keyword for keyword in keywords_lower if keyword}
+    if not keywords_lower:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords_lower:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def keyword_positions(automaton, text_lower):
+    """Start offsets of every keyword of the automaton in text_lower, from a single pass"""
+    positions = {}
+    if automaton is not None:
+        for end, keyword in automaton.iter(text_lower):
+            positions.setdefault(keyword, []).append(end + 1 - len(keyword))
+    return positions
+
+def contains_word(text, word, positions=None):
+    """
+    True if word occurs in text delimited the way the regex \\b<word>\\b would require.
+    Checks the characters around each str.find hit instead of compiling a pattern per keyword.
+    positions: the word's start offsets in text, if already known.
+    """
+    starts_with_word_char = _is_word_char(word[0])
+    ends_with_word_char = _is_word_char(word[-1])
+    for pos in find_all(text, word) if positions is None else positions:
+        end = pos + len(word)
+        before_is_word = pos > 0 and _is_word_char(text[pos - 1])
+        after_is_word = end < len(text) and _is_word_char(text[end])
+        if before_is_word != starts_with_word_char and after_is_word != ends_with_word_char:
+            return True
+    return False
+
+FINANCIAL_INDICATOR_AUTOMATON = keyword_automaton(tuple(FINANCIAL_INDICATORS))
+
+# Each stock's scrape goes over the same channel messages, so the keyword-independent
+# parts of the context check are cached per text
+@lru_cache(maxsize=1024)
+def scan_financial_indicators(text_lower):
+    """
+    One automaton pass over text_lower for the FINANCIAL_INDICATORS checks, reusable
+    for every keyword checked against the text.
+    Returns (is_dense, indicator_spans, indicator_starts): is_dense is True once the
+    text holds at least 3 distinct indicators, in which case the scan stops early and
+    no spans are returned; otherwise the sorted (start, end) spans of every indicator
+    occurrence, with their start offsets for bisecting.
+    """
+    indicator_spans = []
+    found_indicators = set()
+    for end, indicator in FINANCIAL_INDICATOR_AUTOMATON.iter(text_lower):
+        indicator_spans.append((end + 1 - len(indicator), end + 1))
+        found_indicators.add(indicator)
+        if len(found_indicators) >= 3:
+            return True, None, None
+    
+    indicator_spans.sort()
+    return False, indicator_spans, [start for start, _ in indicator_spans]
+
+@lru_cache(maxsize=1024)
+def has_financial_pattern(text_lower):
+    """True if text_lower matches any of FINANCIAL_PATTERNS"""
+    return any(pattern.search(text_lower) for pattern in FINANCIAL_PATTERNS)
+
+def is_financially_relevant_context(text, keyword, indicator_scan=None, positions=None):
     """
     PRODUCTION-READY financial context validation with comprehensive indicators
     Based on extensive testing with real stock database keywords (Nov 8, 2025)
@@ -228,131 +401,44 @@ def is_financially_relevant_context(text, keyword):
     
     This function helps reduce false positives by ensuring the article is actually about finance/business.
     Tested accuracy: 92.9% on challenging edge cases
+    
+    Pass indicator_scan from scan_financial_indicators(text.lower()) when checking
+    several keywords against the same text, and the keyword's start offsets in the
+    lowercased text as positions when they are already known.
     """
     if not text or not keyword:
         return False
     
-    # COMPREHENSIVE Financial context indicators (45+ terms covering all financial aspects)
-    financial_indicators = [
-        # Core Market/Trading terms
-        'stock', 'share', 'market', 'trading', 'investor', 'investment', 'portfolio',
-        'equity', 'securities', 'commodity', 'futures', 'options', 'derivatives',
-        
-        # Indian Market Specific
-        'nifty', 'sensex', 'bse', 'nse', 'sebi', 'rbi', 'rupee', 'inr',
-        
-        # Investment Instruments
-        'mutual fund', 'etf', 'ipo', 'fpo', 'listing', 'delisting', 'bond', 'debenture',
-        
-        # Financial Performance Metrics
-        'profit', 'loss', 'revenue', 'earnings', 'ebitda', 'margin', 'turnover',
-        'dividend', 'buyback', 'split', 'bonus', 'rights issue',
-        
-        # Reporting Periods
-        'quarter', 'quarterly', 'q1', 'q2', 'q3', 'q4', 'half year', 'annual',
-        'financial year', 'fy', 'fy24', 'fy25', 'year-on-year', 'yoy', 'qoq',
-        
-        # Business & Corporate
-        'company', 'corporate', 'business', 'industry', 'sector', 'enterprise',
-        'corporation', 'limited', 'ltd', 'pvt', 'public', 'private',
-        
-        # Leadership & Governance
-        'management', 'board', 'ceo', 'cfo', 'md', 'chairman', 'director',
-        'shareholder', 'stakeholder', 'promoter', 'institutional',
-        
-        # Economic Environment
-        'economy', 'economic', 'gdp', 'inflation', 'deflation', 'recession',
-        'growth', 'expansion', 'contraction', 'fiscal', 'monetary',
-        
-        # Banking & Finance
-        'bank', 'banking', 'finance', 'financial', 'credit', 'loan', 'deposit',
-        'nbfc', 'fintech', 'insurance', 'fund', 'capital', 'debt',
-        
-        # Policy & Regulation
-        'policy', 'regulation', 'compliance', 'audit', 'governance',
-        'budget', 'tax', 'gst', 'income tax', 'corporate tax',
-        
-        # Valuation & Pricing
-        'valuation', 'price', 'value', 'worth', 'cost', 'expense', 'cap',
-        'market cap', 'enterprise value', 'book value', 'fair value',
-        
-        # Market Sentiment & Movement
-        'bullish', 'bearish', 'rally', 'correction', 'crash', 'bubble',
-        'volatile', 'volatility', 'trend', 'momentum', 'sentiment',
-        'surge', 'plunge', 'spike', 'drop', 'gain', 'fall', 'rise',
-        
-        # Indian Currency Amounts
-        'crore', 'lakh', 'thousand', 'million', 'billion', 'trillion',
-        'rs', 'rupees', '₹', '$', 'usd', 'dollar',
-        
-        # Financial Symbols & Percentages
-        '%', 'percent', 'percentage', 'basis points', 'bps',
-        
-        # Business Operations
-        'merger', 'acquisition', 'takeover', 'divestiture', 'spinoff',
-        'restructuring', 'bankruptcy', 'liquidation', 'ipo', 'opo',
-        
-        # Results & Performance
-        'results', 'performance', 'outlook', 'guidance', 'forecast',
-        'estimate', 'consensus', 'target', 'recommendation', 'rating'
-    ]
-    
     text_lower = text.lower()
     
-    # METHOD 1: Context Window Analysis (Primary method)
-    # Find all positions of the keyword in the text
-    keyword_positions = []
-    start = 0
-    keyword_lower = keyword.lower()
-    
-    while True:
-        pos = text_lower.find(keyword_lower, start)
-        if pos == -1:
-            break
-        keyword_positions.append(pos)
-        start = pos + 1
+    # METHOD 2: Overall Financial Density Check (Secondary validation)
+    # If the entire text contains multiple financial indicators (3+ terms), it's likely
+    # finance-related. Checked first since the same scan feeds METHOD 1.
+    if indicator_scan is None:
+        indicator_scan = scan_financial_indicators(text_lower)
+    is_dense, indicator_spans, indicator_starts = indicator_scan
+    if is_dense:
+        return True
     
+    # METHOD 1: Context Window Analysis (Primary method)
     # For each keyword occurrence, check surrounding context (100 characters before and after)
+    # for an indicator that lies entirely inside it. Even 1 indicator in context is significant.
     context_window = 100
-    for pos in keyword_positions:
-        start_context = max(0, pos - context_window)
-        end_context = min(len(text_lower), pos + len(keyword_lower) + context_window)
-        context = text_lower[start_context:end_context]
-        
-        # Check if any financial indicator is in this context window
-        context_indicators_found = 0
-        for indicator in financial_indicators:
-            if indicator in context:
-                context_indicators_found += 1
-                # If we find financial indicators near the keyword, it's likely relevant
-                if context_indicators_found >= 1:  # Even 1 indicator in context is significant
+    keyword_lower = keyword.lower()
+    if indicator_spans:
+        for pos in find_all(text_lower, keyword_lower) if positions is None else positions:
+            start_context = max(0, pos - context_window)
+            end_context = min(len(text_lower), pos + len(keyword_lower) + context_window)
+            
+            i = bisect_left(indicator_starts, start_context)
+            while i < len(indicator_spans) and indicator_starts[i] < end_context:
+                if indicator_spans[i][1] <= end_context:
                     return True
-    
-    # METHOD 2: Overall Financial Density Check (Secondary validation)
-    # If the entire text contains multiple financial indicators, it's likely finance-related
-    total_indicators_found = 0
-    for indicator in financial_indicators:
-        if indicator in text_lower:
-            total_indicators_found += 1
-    
-    # If text has high financial density (3+ terms), consider it financially relevant
-    if total_indicators_found >= 3:
-        return True
+                i += 1
     
     # METHOD 3: Financial Pattern Recognition (Tertiary check)
     # Check for common financial patterns like "Rs 1000 crore", "15% growth", etc.
-    financial_patterns = [
-        r'rs\.?\s*\d+', r'₹\s*\d+', r'\d+\s*crore', r'\d+\s*lakh',
-        r'\d+\s*%', r'\d+\s*percent', r'q[1-4]\s*results', r'fy\d{2}',
-        r'market\s*cap', r'share\s*price', r'stock\s*price',
-        r'earning\s*call', r'annual\s*report', r'financial\s*results'
-    ]
-    
-    for pattern in financial_patterns:
-        if re.search(pattern, text_lower):
-            return True
-    
-    return False
+    return has_financial_pattern(text_lower)
 
 def enhanced_keyword_matching(text, keywords, logger=None):
     """
@@ -375,19 +461,17 @@ def enhanced_keyword_matching(text, keywords, logger=None):
     text_lower = text.lower()
     matched_keywords = []
     
-    # Enhanced stopwords list to filter out common noise words
-    stopwords = {
-        'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'up', 'it', 'is', 'as', 'be', 'an', 'a',
-        'this', 'that', 'will', 'are', 'was', 'has', 'have', 'had', 'can', 'may', 'new', 'all', 'any', 'our', 'out', 'day',
-        'get', 'go', 'see', 'come', 'take', 'make', 'know', 'think', 'say', 'use', 'work', 'first', 'last', 'good', 'great'
-    }
+    # Every keyword's occurrences in the text, from one pass over it; a keyword that
+    # doesn't occur can't pass any of the checks below
+    keyword_pairs = [(kw, kw.lower().strip()) for kw in keywords]
+    present_keywords = keyword_positions(keyword_automaton(tuple(kw_lower for _, kw_lower in keyword_pairs)), text_lower)
+    # The keyword-independent part of the financial context check, done once for the text
+    indicator_scan = scan_financial_indicators(text_lower) if present_keywords else None
     
     # Optional: Whitelist for legitimate 2-character stock symbols (future enhancement)
     # legitimate_short_symbols = {'LT', 'DLF', 'ITC'}  # Major stock symbols
     
-    for kw in keywords:
-        kw_lower = kw.lower().strip()
-        
+    for kw, kw_lower in keyword_pairs:
         # Skip very short keywords (1-2 chars) as they cause too many false positives
         # Exception: Could add whitelist for legitimate symbols like 'LT' in future
         if len(kw_lower) <= 2:
@@ -396,18 +480,22 @@ def enhanced_keyword_matching(text, keywords, logger=None):
             continue
         
         # Skip common stopwords that aren't meaningful for financial news
-        if kw_lower in stopwords:
+        if kw_lower in KEYWORD_STOPWORDS:
             if logger:
                 logger.debug(f"🚫 Skipping stopword '{kw}' - not meaningful for financial context")
             continue
         
+        # Every check below needs the keyword somewhere in the text
+        if kw_lower not in present_keywords:
+            continue
+        positions = present_keywords[kw_lower]
+        
         # SHORT KEYWORDS (3-4 chars): Use strict word boundary matching + financial context required
         if len(kw_lower) <= 4:
             # Use word boundaries to avoid partial matches (e.g., "RIL" in "trillion")
-            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-            if re.search(pattern, text_lower):
+            if contains_word(text_lower, kw_lower, positions):
                 # CRITICAL: Additional context check for financial relevance (prevents false positives)
-                if is_financially_relevant_context(text, kw_lower):
+                if is_financially_relevant_context(text, kw_lower, indicator_scan, positions):
                     matched_keywords.append(kw)
                     if logger:
                         logger.debug(f"✅ SHORT keyword match: '{kw}' found with financial context validation")
@@ -419,15 +507,14 @@ def enhanced_keyword_matching(text, keywords, logger=None):
         # MEDIUM KEYWORDS (5-8 chars): Use word boundary + allow flexible partial matching
         elif len(kw_lower) <= 8:
             # First try exact word boundary match
-            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-            if re.search(pattern, text_lower):
+            if contains_word(text_lower, kw_lower, positions):
                 matched_keywords.append(kw)
                 if logger:
                     logger.debug(f"✅ MEDIUM keyword exact match: '{kw}'")
                 break
             # Also check for partial matches within compound words (e.g., "Axis" in "AxisBank")
-            elif kw_lower in text_lower:
-                if is_financially_relevant_context(text, kw_lower):
+            else:
+                if is_financially_relevant_context(text, kw_lower, indicator_scan, positions):
                     matched_keywords.append(kw)
                     if logger:
                         logger.debug(f"✅ MEDIUM keyword partial match: '{kw}' with financial context")
@@ -438,15 +525,14 @@ def enhanced_keyword_matching(text, keywords, logger=None):
         
         # LONG KEYWORDS (9+ chars): Allow flexible partial matches but verify financial context
         else:
-            if kw_lower in text_lower:
-                if is_financially_relevant_context(text, kw_lower):
-                    matched_keywords.append(kw)
-                    if logger:
-                        logger.debug(f"✅ LONG keyword match: '{kw}' with financial context validation")
-                    break
-                else:
-                    if logger:
-                        logger.debug(f"⚠️ LONG keyword '{kw}' found but REJECTED - lacks financial context")
+            if is_financially_relevant_context(text, kw_lower, indicator_scan, positions):
+                matched_keywords.append(kw)
+                if logger:
+                    logger.debug(f"✅ LONG keyword match: '{kw}' with financial context validation")
+                break
+            else:
+                if logger:
+                    logger.debug(f"⚠️ LONG keyword '{kw}' found but REJECTED - lacks financial context")
     
     # Log summary for debugging
     if logger and matched_keywords:
@@ -1,17 +1,13 @@
+from .supabase_client import get_supabase_client
+from concurrent.futures import ThreadPoolExecutor
+import logging
 
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
+logger = logging.getLogger(__name__)
 
-load_dotenv()
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-def get_supabase_client():
-    """Get Supabase client, creating it only when needed"""
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+# Candidates per bulk lookup, keeping each request's URL (titles in the filter) short
+EXISTING_NEWS_CHUNK_SIZE = 50
+# Rows fetched per request, below Supabase's default max-rows (1000) so a full page means more remain
+EXISTING_NEWS_PAGE_SIZE = 500
 
 def check_existing_news(title, published_at, yfin_symbol):
     """
@@ -47,3 +43,92 @@ def check_existing_news(title, published_at, yfin_symbol):
     except Exception as e:
         print(f"Error checking existing news: {e}")
         return False
+
+def _quote_filter_value(value):
+    """Double-quote a value for a PostgREST filter, escaping backslashes and quotes inside it"""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+def _title_prefix_filter(prefixes):
+    """PostgREST or-filter matching titles that start with any of the prefixes (case-insensitive)"""
+    return ','.join(f'title.ilike.{_quote_filter_value(prefix + "%")}' for prefix in prefixes)
+
+def _title_in_filter(titles):
+    """PostgREST in-list of exact titles. Built here rather than with in_(), which leaves
+    quotes inside a title unescaped and so breaks on headlines like 'Q2: "Strong", says CEO'"""
+    return '(' + ','.join(_quote_filter_value(title) for title in titles) + ')'
+
+def _fetch_all_rows(build_query):
+    """Execute a fresh query from build_query page by page and return every row"""
+    rows = []
+    start = 0
+    while True:
+        page = build_query().range(start, start + EXISTING_NEWS_PAGE_SIZE - 1).execute().data
+        rows.extend(page)
+        if len(page) < EXISTING_NEWS_PAGE_SIZE:
+            return rows
+        start += EXISTING_NEWS_PAGE_SIZE
+
+def _find_existing_chunk(supabase, executor, candidates):
+    """Existing (title, yfin_symbol) pairs among one chunk of deduplicated candidates"""
+    symbols = list({symbol for _, symbol in candidates})
+    title_filter = _title_in_filter({title for title, _ in candidates})
+    
+    # Primary check: exact title and symbol match
+    def exact_query():
+        return supabase.table('news').select('title, yfin_symbol')\
+            .in_('yfin_symbol', symbols)\
+            .filter('title', 'in', title_filter)
+    
+    # Secondary check: same symbol and similar title (first 50 chars) to catch minor variations.
+    # Asked for every long enough title up front so it needn't wait for the exact check.
+    prefix_candidates = [(title, symbol) for title, symbol in candidates if title and len(title) > 10]
+    prefix_symbols = list({symbol for _, symbol in prefix_candidates})
+    prefix_filter = _title_prefix_filter({title[:50] for title, _ in prefix_candidates})
+    
+    def similar_query():
+        return supabase.table('news').select('title, yfin_symbol')\
+            .in_('yfin_symbol', prefix_symbols)\
+            .or_(prefix_filter)
+    
+    exact_future = executor.submit(_fetch_all_rows, exact_query)
+    similar_future = executor.submit(_fetch_all_rows, similar_query) if prefix_candidates else None
+    existing = exact_future.result()
+    similar = similar_future.result() if similar_future else []
+    
+    existing_pairs = {(row['title'], row['yfin_symbol']) for row in existing}
+    found = {candidate for candidate in candidates if candidate in existing_pairs}
+    
+    similar_titles = [(row['title'].lower(), row['yfin_symbol']) for row in similar if row.get('title')]
+    for title, symbol in prefix_candidates:
+        if (title, symbol) in found:
+            continue
+        title_prefix = title[:50].lower()
+        if any(s == symbol and t.startswith(title_prefix) for t, s in similar_titles):
+            logger.info(f"Found similar article for {symbol}: {title[:30]}...")
+            found.add((title, symbol))
+    
+    return found
+
+def find_existing_news(candidates):
+    """
+    Bulk version of check_existing_news for a batch of (title, yfin_symbol) pairs.
+    Checks EXISTING_NEWS_CHUNK_SIZE candidates per exact-match and similar-title query
+    instead of up to two queries per article, running each chunk's two queries
+    concurrently. Returns the set of pairs that already exist. Unlike
+    check_existing_news, errors are logged and re-raised so callers can skip the insert.
+    """
+    candidates = list(dict.fromkeys(candidates))
+    if not candidates:
+        return set()
+    
+    try:
+        supabase = get_supabase_client()
+        found = set()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for i in range(0, len(candidates), EXISTING_NEWS_CHUNK_SIZE):
+                found |= _find_existing_chunk(supabase, executor, candidates[i:i + EXISTING_NEWS_CHUNK_SIZE])
+        return found
+    except Exception as e:
+        logger.error(f"Error checking existing news: {e}")
+        raise
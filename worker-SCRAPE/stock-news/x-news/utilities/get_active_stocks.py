@@ -1,16 +1,4 @@
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-def get_supabase_client():
-    """Get Supabase client, creating it only when needed"""
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+from .supabase_client import get_supabase_client
 
 def get_active_stocks():
     try:
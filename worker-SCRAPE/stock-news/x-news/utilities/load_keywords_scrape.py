@@ -1,30 +1,36 @@
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
+from .supabase_client import get_supabase_client
 import json
+import threading
+import time
 
-load_dotenv()
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-def get_supabase_client():
-    """Get Supabase client, creating it only when needed"""
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+# The active stock list changes rarely; one fetch serves a whole scraper run
+STOCK_KEYWORDS_TTL_SECONDS = 300
+_stock_keywords_cache = None
+_stock_keywords_fetched_at = 0.0
+_stock_keywords_lock = threading.Lock()
 
 def fetch_stock_keywords():
     """
     Fetch keywords for all active stocks from the 'stocks' table.
-    Returns a list of dicts: [{id, yfin_symbol, stock_name, keyword_lst}, ...]
+    Returns a tuple of dicts: ({id, yfin_symbol, stock_name, keyword_lst}, ...)
+    The result is cached for STOCK_KEYWORDS_TTL_SECONDS and shared between callers,
+    so treat it as read-only. Failed fetches are not cached.
     """
-    try:
-        supabase = get_supabase_client()
-        response = supabase.table('stocks').select('id, yfin_symbol, stock_name, keyword_lst').eq('is_active', True).execute()
-        return response.data
-    except Exception as e:
-        print(f"Error fetching stock keywords: {e}")
-        return []
+    global _stock_keywords_cache, _stock_keywords_fetched_at
+    
+    with _stock_keywords_lock:
+        if _stock_keywords_cache is not None and time.monotonic() - _stock_keywords_fetched_at < STOCK_KEYWORDS_TTL_SECONDS:
+            return _stock_keywords_cache
+        
+        try:
+            supabase = get_supabase_client()
+            response = supabase.table('stocks').select('id, yfin_symbol, stock_name, keyword_lst').eq('is_active', True).execute()
+            _stock_keywords_cache = tuple(response.data)
+            _stock_keywords_fetched_at = time.monotonic()
+            return _stock_keywords_cache
+        except Exception as e:
+            print(f"Error fetching stock keywords: {e}")
+            return ()
 
 def fetch_index_keywords():
     """
@@ -1,17 +1,9 @@
+from .supabase_client import get_supabase_client
 from .check_existing_news import check_existing_news
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
+from postgrest.types import ReturnMethod
+import logging
 
-load_dotenv()
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-def get_supabase_client():
-    """Get Supabase client, creating it only when needed"""
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+logger = logging.getLogger(__name__)
 
 def store_news_article(news_data):
     try:
@@ -25,3 +17,35 @@ def store_news_article(news_data):
     except Exception as e:
         print(f"Error storing news article: {e}")
         return False
+
+def store_news_articles(news_rows):
+    """
+    Insert a batch of news rows in a single request. Callers are expected to have
+    filtered out duplicates already (see find_existing_news). If the batch insert
+    fails, the rows are retried one at a time so one bad row doesn't drop the rest.
+    Returns the number of rows stored.
+    """
+    if not news_rows:
+        return 0
+    
+    try:
+        supabase = get_supabase_client()
+    except Exception as e:
+        logger.error(f"Error storing news articles: {e}")
+        return 0
+    
+    try:
+        # The inserted rows aren't needed back; the insert either stores the whole batch or raises
+        supabase.table('news').insert(news_rows, returning=ReturnMethod.minimal).execute()
+        return len(news_rows)
+    except Exception as e:
+        logger.warning(f"Batch insert of {len(news_rows)} news articles failed, retrying one by one: {e}")
+    
+    stored = 0
+    for row in news_rows:
+        try:
+            supabase.table('news').insert(row, returning=ReturnMethod.minimal).execute()
+            stored += 1
+        except Exception as e:
+            logger.error(f"Error storing news article '{row.get('title', '')}': {e}")
+    return stored
@@ -0,0 +1,20 @@
+"""
+Supabase client shared by the news utilities
+"""
+import os
+from functools import lru_cache
+from supabase import create_client, Client
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+SUPABASE_URL = os.getenv('SUPABASE_URL')
+SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Client:
+    """Get Supabase client, creating it only when needed and reusing it (and its
+    connection pool) for every later call"""
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
+    return create_client(SUPABASE_URL, SUPABASE_KEY)